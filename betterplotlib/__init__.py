@@ -7,3 +7,11 @@ from .manage_axes import *
 from ._interface import *
 
 register_projection(Axes_bpl)
+
+
+def __getattr__(name):
+    # pyplot is imported lazily (see manage_axes._ensure_mpl_setup), but
+    # bpl.plt has always been available, so import it when it's first used.
+    if name == "plt":
+        return manage_axes._ensure_mpl_setup()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -18,9 +18,9 @@ def make_ax_dark(grid=True, minor_ticks=False):
     :param grid: Whether or not to draw the grid. Defaults to True.
     :type grid: bool
     :param minor_ticks: Whether or not to add minor ticks. They will be
-                drawn as dotted lines, rather than solid lines in
-                the axes space. If `grid` is False then this
-                parameter does not matter.
+                        drawn as dotted lines, rather than solid lines in
+                        the axes space. If `grid` is False then this
+                        parameter does not matter.
     :type minor_ticks: bool
     :return: None
 
@@ -54,8 +54,8 @@ def remove_ticks(*ticks_to_remove):
     you're having trouble.
 
     :param ticks_to_remove: locations where ticks need to be removed from. Choose
-                from: "all, "top", "bottom", "left", or "right",
-                and pass in as many as you'd like
+                            from: "all, "top", "bottom", "left", or "right",
+                            and pass in as many as you'd like
     :return: None
 
     .. plot::
@@ -100,8 +100,8 @@ def remove_spines(*spines_to_remove):
     for some reason.
 
     :param spines_to_remove: The desired spines to remove. Can
-                 choose from "all", "top", "bottom", "left",
-                 or "right".
+                             choose from "all", "top", "bottom", "left",
+                             or "right".
     :return: None
 
     .. plot::
@@ -143,9 +143,15 @@ def scatter(*args, **kwargs):
     color. This follows the default matplotlib scatter implementation.
 
     :param args: non-keyword arguments that will be passed on to the
-             plt.scatter function. These will typically be the x and y
-             lists.
+                 plt.scatter function. These will typically be the x and y
+                 lists.
     :param kwargs: keyword arguments that will be passed on to plt.scatter.
+    :keyword rasterize_threshold: Scatter plots with more points than this
+                                  are rasterized, which keeps vector
+                                  output (like pdf) small and quick to
+                                  render. The axes, labels, etc. stay as
+                                  vector graphics. Defaults to 1000. Pass
+                                  `rasterized` directly to override this.
     :return: the output of the plt.scatter call is returned directly.
 
     .. plot::
@@ -159,7 +165,7 @@ def scatter(*args, **kwargs):
         y = np.random.normal(0, scale=0.5, size=500)
 
         for dx in [0, 0.5, 1]:
-        bpl.scatter(x + dx, y + dx)
+            bpl.scatter(x + dx, y + dx)
         bpl.equal_scale()
 
     """
@@ -177,22 +183,22 @@ def hist(*args, **kwargs):
     relative frequency plot and `bin_size` controls the width of each bin.
 
     :param args: non-keyword arguments that will be passed on to the
-             plt.hist() function. These will typically be the list of
-             values.
+                 plt.hist() function. These will typically be the list of
+                 values.
     :keyword rel_freq: Whether or not to plot the histogram as a relative
-               frequency histogram. Note that this plots the
-               relative frequency of each bin compared to the whole
-               sample. Even if your range excludes some of the data,
-               it will still be included in the relative frequency
-               calculation.
+                       frequency histogram. Note that this plots the
+                       relative frequency of each bin compared to the whole
+                       sample. Even if your range excludes some of the data,
+                       it will still be included in the relative frequency
+                       calculation.
     :type rel_freq: bool
     :keyword bin_size: The width of the bins in the histogram. The bin
-               boundaries will start at zero, and will be integer
-               multiples of bin_size from there. Specify either
-               this, or bins, but not both.
+                       boundaries will start at zero, and will be integer
+                       multiples of bin_size from there. Specify either
+                       this, or bins, but not both.
     :type bin_size: float
     :keyword kwargs: additional controls that will be passed on through to
-             the plt.hist() function.
+                     the plt.hist() function.
     :return: same output as plt.hist()
 
     Examples:
@@ -236,32 +242,32 @@ def hist(*args, **kwargs):
         data4 = np.random.normal(6, 1, size=10000)
         bin_size = 0.5
         bpl.hist(
-        data1,
-        rel_freq=True,
-        bin_size=bin_size,
+            data1,
+            rel_freq=True,
+            bin_size=bin_size,
         )
         bpl.hist(
-        data2,
-        rel_freq=True,
-        bin_size=bin_size,
-        histtype="step",
-        linewidth=5,
+            data2,
+            rel_freq=True,
+            bin_size=bin_size,
+            histtype="step",
+            linewidth=5,
         )
         bpl.hist(
-        data3,
-        rel_freq=True,
-        bin_size=bin_size,
-        histtype="stepfilled",
-        hatch="o",
-        alpha=0.8,
+            data3,
+            rel_freq=True,
+            bin_size=bin_size,
+            histtype="stepfilled",
+            hatch="o",
+            alpha=0.8,
         )
         bpl.hist(
-        data4,
-        rel_freq=True,
-        bin_size=bin_size,
-        histtype="step",
-        hatch="x",
-        linewidth=4,
+            data4,
+            rel_freq=True,
+            bin_size=bin_size,
+            histtype="step",
+            hatch="x",
+            linewidth=4,
         )
 
         bpl.add_labels(y_label="Relative Frequency")
@@ -286,9 +292,9 @@ def add_labels(x_label=None, y_label=None, title=None, *args, **kwargs):
     :param title: title for the given axis
     :type title: str
     :param args: additional properties that will be passed on to all the
-             labels you asked for.
+                 labels you asked for.
     :param kwargs: additional keyword arguments that will be passed on to
-               all the labels you make.
+                   all the labels you make.
     :return: None
 
     Example:
@@ -385,13 +391,13 @@ def add_text(
     text in that location relative the axes. See above.
     :type coords: str
     :param border_color: An optional color to add a border around the text added.
-                 This is useful for making text more easily visible against
-                 a colorful background
+                         This is useful for making text more easily visible against
+                         a colorful background
     :type border_color: str
     :param border_linewidth: the width of the border added around the text
     :type border_linewidth: int
     :param kwargs: any additional keyword arguments to pass on the text
-               function. Pass things you would pass to plt.text()
+                   function. Pass things you would pass to plt.text()
     :return: Same as output of plt.text().
 
     Example:
@@ -412,12 +418,12 @@ def add_text(
         bpl.add_text(-3, 3, "(-3, 3) data")
         bpl.add_text(0.7, 0.1, "70% across, 10% up", "axes")
         bpl.add_text(
-        0,
-        0,
-        "(0, 0) data, black border",
-        color="white",
-        border_color=bpl.almost_black,
-        border_linewidth=3,
+            0,
+            0,
+            "(0, 0) data, black border",
+            color="white",
+            border_color=bpl.almost_black,
+            border_linewidth=3,
         )
 
     """
@@ -438,7 +444,7 @@ def remove_labels(labels_to_remove):
     you're having trouble.
 
     :param labels_to_remove: location of labels to remove. Choose from:
-                 "both", "x", or "y".
+                             "both", "x", or "y".
     :type labels_to_remove: str
     :return: None
 
@@ -476,12 +482,12 @@ def legend(linewidth=0, *args, **kwargs):
     make the legend look nice.
 
     :param linewidth: linewidth of the border of the legend. Defaults to
-              zero.
+                      zero.
     :type linewidth: float
     :param args: non-keyword arguments passed on to the ax.legend() fuction.
     :param kwargs: keyword arguments that will be passed on to the
-               ax.legend() function. This will be things like loc,
-               and title, etc.
+                   ax.legend() function. This will be things like loc,
+                   and title, etc.
     :return: legend object returned by the ax.legend() function.
 
     The default legend is a transparent background with no border, like so.
@@ -501,10 +507,10 @@ def legend(linewidth=0, *args, **kwargs):
         ax2 = fig.add_subplot(122, projection="bpl")  # bpl subplot.
 
         for ax in [ax1, ax2]:
-        ax.plot(x, x, label="x")
-        ax.plot(x, 2*x, label="2x")
-        ax.plot(x, 3*x, label="3x")
-        ax.legend(loc=2)
+            ax.plot(x, x, label="x")
+            ax.plot(x, 2*x, label="2x")
+            ax.plot(x, 3*x, label="3x")
+            ax.legend(loc=2)
 
         ax1.set_title("matplotlib")
         ax2.set_title("betterplotlib")
@@ -643,21 +649,21 @@ def easy_add_text(text, location, **kwargs):
     :param text: Text to add to the axes.
     :type text: str
     :param location: Location to add the text. This can be specified two
-             in two possible ways. You can pass an integer, which
-             puts the text at the location corresponding to that
-             number's location on a standard keyboard numpad.
-             You can also pass a string that describe the location.
-             'upper', 'center', and 'lower' describe the vertical
-             location, and 'left', 'center', and 'right' describe
-             the horizontal location. You need to specify vertical,
-             then horizontal, like 'upper right'. Note that
-             'center' is the code for the center, not
-             'center center'.
+                     in two possible ways. You can pass an integer, which
+                     puts the text at the location corresponding to that
+                     number's location on a standard keyboard numpad.
+                     You can also pass a string that describe the location.
+                     'upper', 'center', and 'lower' describe the vertical
+                     location, and 'left', 'center', and 'right' describe
+                     the horizontal location. You need to specify vertical,
+                     then horizontal, like 'upper right'. Note that
+                     'center' is the code for the center, not
+                     'center center'.
     :type location: str, int
     :param kwargs: additional text parameters that will be passed on to the
-               plt.text() function. Note that this function controls the
-               x and y location, as well as the horizonatl and vertical
-               alignment, so do not pass those parameters.
+                   plt.text() function. Note that this function controls the
+                   x and y location, as well as the horizonatl and vertical
+                   alignment, so do not pass those parameters.
     :return: Same as output of plt.text()
 
     Example:
@@ -702,9 +708,39 @@ def easy_add_text(text, location, **kwargs):
     return ax.easy_add_text(text, location, **kwargs)
 
 
+def easy_add_texts(texts_and_locations, **kwargs):
+    """
+    Adds several pieces of text in common spots at once.
+
+    This is the same as calling `easy_add_text` for each piece of text, with
+    the same keyword arguments applied to all of them.
+
+    :param texts_and_locations: List of (text, location) pairs. The locations
+                                are specified the same way as in
+                                `easy_add_text`.
+    :type texts_and_locations: list
+    :param kwargs: Additional keyword arguments that will be passed on to
+                   `add_text` for every piece of text. As in `easy_add_text`,
+                   the alignment and `coords` can't be set.
+    :return: list of the text objects that were added.
+
+    .. plot::
+        :include-source:
+
+        import betterplotlib as bpl
+        bpl.set_style()
+
+        bpl.easy_add_texts(
+            [("lower left", 1), ("center", 5), ("upper right", 9)], fontsize=24
+        )
+    """
+    ax = get_axis()
+    return ax.easy_add_texts(texts_and_locations, **kwargs)
+
+
 def density_contour(
     xs,
-    ys,
+    ys=None,
     bin_size=None,
     percent_levels=None,
     smoothing=0,
@@ -723,52 +759,54 @@ def density_contour(
     These contours are just lines, not filled regions. Check out
     `density_contourf()` for that.
 
-    :param xs: list of x values
+    :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+               is not passed.
     :type xs: list, ndarray
-    :param ys: list of y values
-    :type ys: list, ndarray
+    :param ys: list of y values. Leave this out to pass all the points in
+               `xs` as an (N, 2) array.
+    :type ys: list, ndarray, None
     :param bin_size: Bin size to use for the underlying 2D histogram. This
-             can either be a scalar, in which case the bin size will
-             be the same in both the x dimensions, or else a two
-             element list, where the first element will be the
-             bin size in the x dimension, and the second will be
-             the bin size in the y dimension.
+                     can either be a scalar, in which case the bin size will
+                     be the same in both the x dimensions, or else a two
+                     element list, where the first element will be the
+                     bin size in the x dimension, and the second will be
+                     the bin size in the y dimension.
     :type bin_size: int, float, list
     :param percent_levels: A list describing the levels of the contours that
-                   will be drawn. Each value in this list contains
-                   a float between zero and 1 (inclusive) that
-                   describes how much of that data will be enclosed
-                   by a contour. So if you pass [0.25, 0.5, 0.75],
-                   there will be three contours drawn, that enclose
-                   25%, 50%, and 75% of the data. If this is not
-                   passed in, the default is
-                   [0.25, 0.5, 0.75, 0.95].
+                           will be drawn. Each value in this list contains
+                           a float between zero and 1 (inclusive) that
+                           describes how much of that data will be enclosed
+                           by a contour. So if you pass [0.25, 0.5, 0.75],
+                           there will be three contours drawn, that enclose
+                           25%, 50%, and 75% of the data. If this is not
+                           passed in, the default is
+                           [0.25, 0.5, 0.75, 0.95].
     :type percent_levels: float, list
     :param smoothing: Optional parameter that will allow the contours to be
-              smoothed. Pass in a nonzero value, which will be the
-              standard deviation of the Gaussian kernel use to smooth
-              the histogram. When using this, often choosing smaller
-              bin sizes is advantageous to make a less grainy plot.
-              Has the same format as padding and bin_size, so different
-              smoothing kernels are possible in the x and y directions.
+                      smoothed. Pass in a nonzero value, which will be the
+                      standard deviation of the Gaussian kernel use to smooth
+                      the histogram. When using this, often choosing smaller
+                      bin sizes is advantageous to make a less grainy plot.
+                      Has the same format as padding and bin_size, so different
+                      smoothing kernels are possible in the x and y directions.
     :type smoothing: int, float, list
     :param weights: A list containing weights for each data point. If these
-            are not passed, all data points will be weighted
-            equally.
+                    are not passed, all data points will be weighted
+                    equally.
     :type weights: list, np.ndarray
     :param log: Whether or not to do the smoothing and bin creation in log
-            space. This should be used if the plot will be done on
-            log-scaled axes.Can either be a single bool, in which case the
-            x and y scales will both be log (or not), or a two element
-            array, where the first is whether the x axis is log, and the
-            second is y. If this is used, the bin_size and smoothing
-            parameters will be interpreted as dex, rather than raw values.
+                space. This should be used if the plot will be done on
+                log-scaled axes.Can either be a single bool, in which case the
+                x and y scales will both be log (or not), or a two element
+                array, where the first is whether the x axis is log, and the
+                second is y. If this is used, the bin_size and smoothing
+                parameters will be interpreted as dex, rather than raw values.
     :type log: bool, list
     :param labels: Whether or not to label the individual contour lines
-               with their percentage level.
+                   with their percentage level.
     :type labels: bool
     :param kwargs: Additional keyword arguments to pass on to the original
-               matplotlib contour function.
+                   matplotlib contour function.
     :return: output of the matplotlib.contour function.
 
     .. plot::
@@ -780,16 +818,16 @@ def density_contour(
         bpl.set_style()
 
         xs = np.concatenate(
-        [
-            np.random.normal(3, 2, 1000),
-            np.random.normal(7, 2, 1000),
-        ]
+            [
+                np.random.normal(3, 2, 1000),
+                np.random.normal(7, 2, 1000),
+            ]
         )
         ys = np.concatenate(
-        [
-            np.random.normal(7, 2, 1000),
-            np.random.normal(3, 2, 1000),
-        ]
+            [
+                np.random.normal(7, 2, 1000),
+                np.random.normal(3, 2, 1000),
+            ]
         )
 
         bpl.density_contour(xs, ys, bin_size=0.01, smoothing=0.5, cmap="inferno")
@@ -805,21 +843,21 @@ def density_contour(
         bpl.set_style()
 
         xs = np.concatenate(
-        [
-            np.random.normal(3, 2, 1000),
-            np.random.normal(7, 2, 1000),
-        ]
+            [
+                np.random.normal(3, 2, 1000),
+                np.random.normal(7, 2, 1000),
+            ]
         )
         ys = 10 ** np.concatenate(
-        [
-            np.random.normal(7, 2, 1000),
-            np.random.normal(3, 2, 1000),
-        ]
+            [
+                np.random.normal(7, 2, 1000),
+                np.random.normal(3, 2, 1000),
+            ]
         )
 
         fig, ax = bpl.subplots()
         ax.density_contour(
-        xs, ys, bin_size=0.01, smoothing=0.5, log=[False, True], cmap="inferno"
+            xs, ys, bin_size=0.01, smoothing=0.5, log=[False, True], cmap="inferno"
         )
         ax.log("y")
         ax.set_limits(0, 10, 1, 1e10)
@@ -827,21 +865,13 @@ def density_contour(
     """
     ax = get_axis()
     return ax.density_contour(
-        xs,
-        ys,
-        bin_size,
-        percent_levels,
-        smoothing,
-        weights,
-        log,
-        labels,
-        **kwargs,
+        xs, ys, bin_size, percent_levels, smoothing, weights, log, labels, **kwargs
     )
 
 
 def density_contourf(
     xs,
-    ys,
+    ys=None,
     bin_size=None,
     percent_levels=None,
     smoothing=0,
@@ -859,49 +889,51 @@ def density_contourf(
     These contours are just filled regions with no lines. Check out
     `density_contour()` for that.
 
-    :param xs: list of x values
+    :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+               is not passed.
     :type xs: list, ndarray
-    :param ys: list of y values
-    :type ys: list, ndarray
+    :param ys: list of y values. Leave this out to pass all the points in
+               `xs` as an (N, 2) array.
+    :type ys: list, ndarray, None
     :param bin_size: Bin size to use for the underlying 2D histogram. This
-             can either be a scalar, in which case the bin size will
-             be the same in both the x dimensions, or else a two
-             element list, where the first element will be the
-             bin size in the x dimension, and the second will be
-             the bin size in the y dimension.
+                     can either be a scalar, in which case the bin size will
+                     be the same in both the x dimensions, or else a two
+                     element list, where the first element will be the
+                     bin size in the x dimension, and the second will be
+                     the bin size in the y dimension.
     :type bin_size: int, float, list
     :param percent_levels: A list describing the levels of the contours that
-                   will be drawn. Each value in this list contains
-                   a float between zero and 1 (inclusive) that
-                   describes how much of that data will be enclosed
-                   by a contour. So if you pass [0.25, 0.5, 0.75],
-                   there will be three contours drawn, that enclose
-                   25%, 50%, and 75% of the data. If this is not
-                   passed in, the default is
-                   [0.25, 0.5, 0.75, 0.95].
+                           will be drawn. Each value in this list contains
+                           a float between zero and 1 (inclusive) that
+                           describes how much of that data will be enclosed
+                           by a contour. So if you pass [0.25, 0.5, 0.75],
+                           there will be three contours drawn, that enclose
+                           25%, 50%, and 75% of the data. If this is not
+                           passed in, the default is
+                           [0.25, 0.5, 0.75, 0.95].
     :type percent_levels: float, list
     :param smoothing: Optional parameter that will allow the contours to be
-              smoothed. Pass in a nonzero value, which will be the
-              standard deviation of the Gaussian kernel use to smooth
-              the histogram. When using this, often choosing smaller
-              bin sizes is advantageous to make a less grainy plot.
-              Has the same format as padding and bin_size, so different
-              smoothing kernels are possible in the x and y directions.
+                      smoothed. Pass in a nonzero value, which will be the
+                      standard deviation of the Gaussian kernel use to smooth
+                      the histogram. When using this, often choosing smaller
+                      bin sizes is advantageous to make a less grainy plot.
+                      Has the same format as padding and bin_size, so different
+                      smoothing kernels are possible in the x and y directions.
     :type smoothing: int, float, list
     :param weights: A list containing weights for each data point. If these
-            are not passed, all data points will be weighted
-            equally.
+                    are not passed, all data points will be weighted
+                    equally.
     :type weights: list, np.ndarray
     :param log: Whether or not to do the smoothing and bin creation in log
-            space. This should be used if the plot will be done on
-            log-scaled axes.Can either be a single bool, in which case the
-            x and y scales will both be log (or not), or a two element
-            array, where the first is whether the x axis is log, and the
-            second is y. If this is used, the bin_size and smoothing
-            parameters will be interpreted as dex, rather than raw values.
+                space. This should be used if the plot will be done on
+                log-scaled axes.Can either be a single bool, in which case the
+                x and y scales will both be log (or not), or a two element
+                array, where the first is whether the x axis is log, and the
+                second is y. If this is used, the bin_size and smoothing
+                parameters will be interpreted as dex, rather than raw values.
     :type log: bool, list
     :param kwargs: Additional keyword arguments to pass on to the original
-               matplotlib contour function.
+                   matplotlib contour function.
     :return: output of the matplotlib.contourf function.
 
     .. plot::
@@ -913,16 +945,16 @@ def density_contourf(
         bpl.set_style()
 
         xs = np.concatenate(
-        [
-            np.random.normal(3, 2, 1000),
-            np.random.normal(7, 2, 1000),
-        ]
+            [
+                np.random.normal(3, 2, 1000),
+                np.random.normal(7, 2, 1000),
+            ]
         )
         ys = np.concatenate(
-        [
-            np.random.normal(7, 2, 1000),
-            np.random.normal(3, 2, 1000),
-        ]
+            [
+                np.random.normal(7, 2, 1000),
+                np.random.normal(3, 2, 1000),
+            ]
         )
 
         bpl.density_contourf(xs, ys, bin_size=0.01, smoothing=0.5, cmap="inferno")
@@ -938,21 +970,21 @@ def density_contourf(
         bpl.set_style()
 
         xs = 10 ** np.concatenate(
-        [
-            np.random.normal(3, 2, 1000),
-            np.random.normal(7, 2, 1000),
-        ]
+            [
+                np.random.normal(3, 2, 1000),
+                np.random.normal(7, 2, 1000),
+            ]
         )
         ys = np.concatenate(
-        [
-            np.random.normal(7, 2, 1000),
-            np.random.normal(3, 2, 1000),
-        ]
+            [
+                np.random.normal(7, 2, 1000),
+                np.random.normal(3, 2, 1000),
+            ]
         )
 
         fig, ax = bpl.subplots()
         ax.density_contourf(
-        xs, ys, bin_size=0.01, smoothing=0.5, log=[True, False], cmap="inferno"
+            xs, ys, bin_size=0.01, smoothing=0.5, log=[True, False], cmap="inferno"
         )
         ax.log("x")
         ax.set_limits(1, 1e10, 0, 10)
@@ -960,20 +992,13 @@ def density_contourf(
     """
     ax = get_axis()
     return ax.density_contourf(
-        xs,
-        ys,
-        bin_size,
-        percent_levels,
-        smoothing,
-        weights,
-        log,
-        **kwargs,
+        xs, ys, bin_size, percent_levels, smoothing, weights, log, **kwargs
     )
 
 
 def contour_scatter(
     xs,
-    ys,
+    ys=None,
     bin_size=None,
     percent_levels=None,
     smoothing=0,
@@ -983,6 +1008,7 @@ def contour_scatter(
     scatter_kwargs=None,
     contour_kwargs=None,
     contourf_kwargs=None,
+    scatter_max_points=None,
 ):
     """
     Create a contour plot with scatter points in the sparse regions.
@@ -1006,64 +1032,74 @@ def contour_scatter(
     check which of the points are outside of this contour. Only the points
     that are outside are plotted.
 
-    :param xs: list of x values
+    :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+               is not passed.
     :type xs: list, ndarray
-    :param ys: list of y values
-    :type ys: list, ndarray
+    :param ys: list of y values. Leave this out to pass all the points in
+               `xs` as an (N, 2) array.
+    :type ys: list, ndarray, None
     :param bin_size: Bin size to use for the underlying 2D histogram. This
-             can either be a scalar, in which case the bin size will
-             be the same in both the x dimensions, or else a two
-             element list, where the first element will be the
-             bin size in the x dimension, and the second will be
-             the bin size in the y dimension.
+                     can either be a scalar, in which case the bin size will
+                     be the same in both the x dimensions, or else a two
+                     element list, where the first element will be the
+                     bin size in the x dimension, and the second will be
+                     the bin size in the y dimension.
     :type bin_size: int, float, list
     :param percent_levels: A list describing the levels of the contours that
-                   will be drawn. Each value in this list contains
-                   a float between zero and 1 (inclusive) that
-                   describes how much of that data will be enclosed
-                   by a contour. So if you pass [0.25, 0.5, 0.75],
-                   there will be three contours drawn, that enclose
-                   25%, 50%, and 75% of the data. If this is not
-                   passed in, the default is
-                   [0.25, 0.5, 0.75, 0.95].
+                           will be drawn. Each value in this list contains
+                           a float between zero and 1 (inclusive) that
+                           describes how much of that data will be enclosed
+                           by a contour. So if you pass [0.25, 0.5, 0.75],
+                           there will be three contours drawn, that enclose
+                           25%, 50%, and 75% of the data. If this is not
+                           passed in, the default is
+                           [0.25, 0.5, 0.75, 0.95].
     :type percent_levels: float, list
     :param smoothing: Optional parameter that will allow the contours to be
-              smoothed. Pass in a nonzero value, which will be the
-              standard deviation of the Gaussian kernel use to smooth
-              the histogram. When using this, often choosing smaller
-              bin sizes is advantageous to make a less grainy plot.
-              Has the same format as padding and bin_size, so different
-              smoothing kernels are possible in the x and y directions.
+                      smoothed. Pass in a nonzero value, which will be the
+                      standard deviation of the Gaussian kernel use to smooth
+                      the histogram. When using this, often choosing smaller
+                      bin sizes is advantageous to make a less grainy plot.
+                      Has the same format as padding and bin_size, so different
+                      smoothing kernels are possible in the x and y directions.
     :type smoothing: int, float, list
     :param weights: A list containing weights for each data point. If these
-            are not passed, all data points will be weighted
-            equally.
+                    are not passed, all data points will be weighted
+                    equally.
     :type weights: list, np.ndarray
     :param labels: Whether or not to label the individual contour lines
-               with their percentage level.
+                   with their percentage level.
     :type labels: bool
     :param fill_cmap: The colormap used for the filled regions. Can be
-              a strong with any named matplotlib colormap or a
-              colormap object. In addition, there are some special
-              strings that can be used. "white", which is just a
-              solid white fill, is the default.  "background_grey"
-              gives a solid fill that is the same color as the
-              make_ax_dark() background. "modified_greys" is a
-              colormap that starts at the "background_grey" color,
-              then transitions to black.
+                      a strong with any named matplotlib colormap or a
+                      colormap object. In addition, there are some special
+                      strings that can be used. "white", which is just a
+                      solid white fill, is the default.  "background_grey"
+                      gives a solid fill that is the same color as the
+                      make_ax_dark() background. "modified_greys" is a
+                      colormap that starts at the "background_grey" color,
+                      then transitions to black.
     :type fill_cmap: str, matplotlib.colors.LinearSegmentedColormap
     :param scatter_kwargs: Dictionary of additional parameters that will be
-                   passed to the underlying matplotlib scatter
-                   function used for points in the outer regions.
+                           passed to the underlying matplotlib scatter
+                           function used for points in the outer regions.
     :type scatter_kwargs: dict
     :param contour_kwargs: Dictionary of additional parameters that will be
-                   passed to the underlying matplotlib contour
-                   function.
+                           passed to the underlying matplotlib contour
+                           function.
     :type contour_kwargs: dict
     :param contourf_kwargs: Dictionary of additional parameters that will be
-                passed to the underlying matplotlib contourf
-                function.
+                            passed to the underlying matplotlib contourf
+                            function. If this sets `alpha` to 0, the filled
+                            contours are skipped entirely.
     :type contourf_kwargs: dict
+    :param scatter_max_points: The most points to scatter in the outer
+                               regions. If there are more than this, a
+                               random subset of them is plotted, which can
+                               make plots of very large datasets much faster
+                               to draw. The same data always gives the same
+                               subset. The default of None plots them all.
+    :type scatter_max_points: int
 
     Examples
 
@@ -1080,18 +1116,18 @@ def contour_scatter(
         bpl.set_style()
 
         xs = np.concatenate(
-        [
-            np.random.normal(0, 1, 100000),
-            np.random.normal(3, 1, 100000),
-            np.random.normal(0, 1, 100000),
-        ]
+            [
+                np.random.normal(0, 1, 100000),
+                np.random.normal(3, 1, 100000),
+                np.random.normal(0, 1, 100000),
+            ]
         )
         ys = np.concatenate(
-        [
-            np.random.normal(0, 1, 100000),
-            np.random.normal(3, 1, 100000),
-            np.random.normal(3, 1, 100000),
-        ]
+            [
+                np.random.normal(0, 1, 100000),
+                np.random.normal(3, 1, 100000),
+                np.random.normal(3, 1, 100000),
+            ]
         )
 
         fig, (ax1, ax2) = bpl.subplots(ncols=2, figsize=[10, 5])
@@ -1113,18 +1149,18 @@ def contour_scatter(
         bpl.set_style()
 
         xs = np.concatenate(
-        [
-            np.random.normal(0, 1, 10000),
-            np.random.normal(3, 1, 10000),
-            np.random.normal(0, 1, 10000),
-        ]
+            [
+                np.random.normal(0, 1, 10000),
+                np.random.normal(3, 1, 10000),
+                np.random.normal(0, 1, 10000),
+            ]
         )
         ys = np.concatenate(
-        [
-            np.random.normal(0, 1, 10000),
-            np.random.normal(3, 1, 10000),
-            np.random.normal(3, 1, 10000),
-        ]
+            [
+                np.random.normal(0, 1, 10000),
+                np.random.normal(3, 1, 10000),
+                np.random.normal(3, 1, 10000),
+            ]
         )
 
         fig, (ax1, ax2, ax3) = bpl.subplots(ncols=3, figsize=[15, 5])
@@ -1149,18 +1185,18 @@ def contour_scatter(
         bpl.set_style()
 
         xs = np.concatenate(
-        [
-            np.random.normal(0, 1, 10000),
-            np.random.normal(3, 1, 10000),
-            np.random.normal(0, 1, 10000),
-        ]
+            [
+                np.random.normal(0, 1, 10000),
+                np.random.normal(3, 1, 10000),
+                np.random.normal(0, 1, 10000),
+            ]
         )
         ys = np.concatenate(
-        [
-            np.random.normal(0, 1, 10000),
-            np.random.normal(3, 1, 10000),
-            np.random.normal(3, 1, 10000),
-        ]
+            [
+                np.random.normal(0, 1, 10000),
+                np.random.normal(3, 1, 10000),
+                np.random.normal(3, 1, 10000),
+            ]
         )
 
         fig, (ax1, ax2, ax3) = bpl.subplots(ncols=3, figsize=[15, 5])
@@ -1185,14 +1221,14 @@ def contour_scatter(
         ys = [1, 2, 3, 4]
         weights = [1, 2, 3, 4]
         bpl.contour_scatter(
-        xs,
-        ys,
-        weights=weights,
-        bin_size=0.01,
-        smoothing=[0.8, 0.3],
-        fill_cmap="Blues",
-        labels=True,
-        contour_kwargs={"colors": "k"},
+            xs,
+            ys,
+            weights=weights,
+            bin_size=0.01,
+            smoothing=[0.8, 0.3],
+            fill_cmap="Blues",
+            labels=True,
+            contour_kwargs={"colors": "k"},
         )
         bpl.equal_scale()
 
@@ -1211,18 +1247,18 @@ def contour_scatter(
         bpl.set_style()
 
         xs = np.concatenate(
-        [
-            np.random.normal(0, 1, 10000),
-            np.random.normal(3, 1, 10000),
-            np.random.normal(0, 1, 10000),
-        ]
+            [
+                np.random.normal(0, 1, 10000),
+                np.random.normal(3, 1, 10000),
+                np.random.normal(0, 1, 10000),
+            ]
         )
         ys = np.concatenate(
-        [
-            np.random.normal(0, 1, 10000),
-            np.random.normal(3, 1, 10000),
-            np.random.normal(3, 1, 10000),
-        ]
+            [
+                np.random.normal(0, 1, 10000),
+                np.random.normal(3, 1, 10000),
+                np.random.normal(3, 1, 10000),
+            ]
         )
 
         fig, axs = bpl.subplots(nrows=2, ncols=2)
@@ -1233,63 +1269,63 @@ def contour_scatter(
         bin_size = 0.1
 
         ax1.contour_scatter(
-        xs,
-        ys,
-        bin_size=bin_size,
-        percent_levels=percent_levels,
-        smoothing=smoothing,
-        fill_cmap="background_grey",
-        contour_kwargs={"cmap": "magma"},
-        scatter_kwargs={"s": 10, "c": bpl.almost_black},
+            xs,
+            ys,
+            bin_size=bin_size,
+            percent_levels=percent_levels,
+            smoothing=smoothing,
+            fill_cmap="background_grey",
+            contour_kwargs={"cmap": "magma"},
+            scatter_kwargs={"s": 10, "c": bpl.almost_black},
         )
         ax1.make_ax_dark()
 
         # or we can choose our own `fill_cmap`
         ax2.contour_scatter(
-        xs,
-        ys,
-        bin_size=bin_size,
-        smoothing=smoothing,
-        fill_cmap="viridis",
-        percent_levels=percent_levels,
-        contour_kwargs={"linewidths": 1, "colors": "white"},
-        scatter_kwargs={"s": 50, "c": bpl.color_cycle[3], "alpha": 0.3},
+            xs,
+            ys,
+            bin_size=bin_size,
+            smoothing=smoothing,
+            fill_cmap="viridis",
+            percent_levels=percent_levels,
+            contour_kwargs={"linewidths": 1, "colors": "white"},
+            scatter_kwargs={"s": 50, "c": bpl.color_cycle[3], "alpha": 0.3},
         )
 
         # There are also my colormaps that work with the dark axes
         ax3.contour_scatter(
-        xs,
-        ys,
-        bin_size=bin_size,
-        smoothing=smoothing,
-        fill_cmap="modified_greys",
-        percent_levels=percent_levels,
-        scatter_kwargs={"c": bpl.color_cycle[0]},
-        contour_kwargs={
-            "linewidths": [2, 0, 0, 0, 0, 0, 0],
-            "colors": bpl.almost_black,
-        },
+            xs,
+            ys,
+            bin_size=bin_size,
+            smoothing=smoothing,
+            fill_cmap="modified_greys",
+            percent_levels=percent_levels,
+            scatter_kwargs={"c": bpl.color_cycle[0]},
+            contour_kwargs={
+                "linewidths": [2, 0, 0, 0, 0, 0, 0],
+                "colors": bpl.almost_black,
+            },
         )
         ax3.make_ax_dark()
 
         # the default `fill_cmap` is white.
         new_linestyles = ["solid", "dashed", "dashed", "dashed"]
         ax4.contour_scatter(
-        xs,
-        ys,
-        bin_size=bin_size,
-        smoothing=smoothing,
-        percent_levels=percent_levels,
-        scatter_kwargs={
-            "marker": "^",
-            "linewidth": 0.2,
-            "c": bpl.color_cycle[1],
-            "s": 20,
-        },
-        contour_kwargs={
-            "linestyles": new_linestyles,
-            "colors": bpl.almost_black,
-        },
+            xs,
+            ys,
+            bin_size=bin_size,
+            smoothing=smoothing,
+            percent_levels=percent_levels,
+            scatter_kwargs={
+                "marker": "^",
+                "linewidth": 0.2,
+                "c": bpl.color_cycle[1],
+                "s": 20,
+            },
+            contour_kwargs={
+                "linestyles": new_linestyles,
+                "colors": bpl.almost_black,
+            },
         )
 
     Note that the contours will work appropriately for datasets with
@@ -1304,18 +1340,18 @@ def contour_scatter(
 
         rad1 = np.random.normal(10, 0.75, 10000)
         theta1 = np.random.uniform(0, 2 * np.pi, 10000)
-        x1 = [r * np.cos(t) for r, t in zip(rad1, theta1)]
-        y1 = [r * np.sin(t) for r, t in zip(rad1, theta1)]
+        x1 = rad1 * np.cos(theta1)
+        y1 = rad1 * np.sin(theta1)
 
         rad2 = np.random.normal(20, 0.75, 20000)
         theta2 = np.random.uniform(0, 2 * np.pi, 20000)
-        x2 = [r * np.cos(t) for r, t in zip(rad2, theta2)]
-        y2 = [r * np.sin(t) for r, t in zip(rad2, theta2)]
+        x2 = rad2 * np.cos(theta2)
+        y2 = rad2 * np.sin(theta2)
 
         rad3 = np.random.normal(12, 0.75, 12000)
         theta3 = np.random.uniform(0, 2 * np.pi, 12000)
-        x3 = [r * np.cos(t) + 10 for r, t in zip(rad3, theta3)]
-        y3 = [r * np.sin(t) + 10 for r, t in zip(rad3, theta3)]
+        x3 = rad3 * np.cos(theta3) + 10
+        y3 = rad3 * np.sin(theta3) + 10
 
         x4 = np.random.uniform(-20, 20, 3500)
         y4 = x4 + np.random.normal(0, 0.5, 3500)
@@ -1343,33 +1379,44 @@ def contour_scatter(
         scatter_kwargs,
         contour_kwargs,
         contourf_kwargs,
+        scatter_max_points,
     )
 
 
-def data_ticks(x_data, y_data, extent=0.015, *args, **kwargs):
+def data_ticks(x_data, y_data, extent=0.015, **kwargs):
     """
     Puts tiny ticks on the axis borders making the location of each point.
 
     :param x_data: list of values to mark on the x-axis.
     :type x_data: list
     :param y_data: list of values to mark on the y-axis. This doesn't have
-               to be the same length as `x-data`, necessarily.
+                   to be the same length as `x-data`, necessarily.
     :type y_data: list
     :param extent: How far the ticks go up from the x-axis. The default is
-               0.02, meaning the ticks go 2% of the way to the top of
-               the plot. Note that the ticks created by this function
-               will have the same physical size on both axes. Since in
-               general the x and y axes aren't the same physical size,
-               the ticks on the y-axis will be scaled to match the
-               physical size of the x ticks. This means that in the
-               default case, the y ticks won't cover 2% of the axis, but
-               again will be the same physical size as the x ticks.
+                   0.02, meaning the ticks go 2% of the way to the top of
+                   the plot. Note that the ticks created by this function
+                   will have the same physical size on both axes. Since in
+                   general the x and y axes aren't the same physical size,
+                   the ticks on the y-axis will be scaled to match the
+                   physical size of the x ticks. This means that in the
+                   default case, the y ticks won't cover 2% of the axis, but
+                   again will be the same physical size as the x ticks.
     :type extent: float
-    :param args: Additional arguments to pass to the `axvline` and `axhline`
-             functions, which is what is used to make each tick.
-    :param kwargs: Additional keyword arguments to pass to the `axvline` and
-               `axhline` functions. `color` is an important one here,
-               and it defaults to `almost_black` here.
+    :param kwargs: Additional keyword arguments to pass to the `axvlines`
+                   and `axhlines` functions, which are used to make the
+                   ticks. These go to a `LineCollection`, so options that
+                   only `Line2D` has (like `marker`, `drawstyle`, or
+                   `solid_capstyle`) aren't accepted. Use `capstyle` to
+                   change the ends of the ticks. `color` is an important one
+                   here, and it defaults to `almost_black` here.
+    :return: The `LineCollection`s holding the x and y ticks. Versions up
+             to 1.12.9 returned None.
+    :rtype: tuple
+
+    The ticks add the data values to the data limits, so if nothing else is
+    on the axes the limits are the data range plus the usual margins on
+    each axis. Up to version 1.12.9 each tick was its own `axvline` or
+    `axhline`, which could leave the limits slightly different from this.
 
 
     Example
@@ -1388,7 +1435,7 @@ def data_ticks(x_data, y_data, extent=0.015, *args, **kwargs):
         bpl.data_ticks(xs, ys)
     """
     ax = get_axis()
-    return ax.data_ticks(x_data, y_data, extent, *args, **kwargs)
+    return ax.data_ticks(x_data, y_data, extent, **kwargs)
 
 
 def plot(*args, **kwargs):
@@ -1441,13 +1488,15 @@ def axvline(x=0, *args, **kwargs):
     """
     Place a vertical line at some point on the axes.
 
+    To place many lines at once, `axvlines` is much faster.
+
     :param x: Data value on the x-axis to place the line.
     :type x: float
     :param args: Additional parameters that will be passed on the the
-             regular `plt.axvline` function. See it's documentation
-             for details.
+                 regular `plt.axvline` function. See it's documentation
+                 for details.
     :param kwargs: Similarly, additional keyword arguments that will be
-               passed on to the regular `plt.axvline` function.
+                   passed on to the regular `plt.axvline` function.
 
     .. plot::
         :include-source:
@@ -1477,13 +1526,15 @@ def axhline(y=0, *args, **kwargs):
     """
     Place a horizontal line at some point on the axes.
 
+    To place many lines at once, `axhlines` is much faster.
+
     :param y: Data value on the y-axis to place the line.
     :type y: float
     :param args: Additional parameters that will be passed on the the
-             regular `plt.axhline` function. See it's documentation
-             for details.
+                 regular `plt.axhline` function. See it's documentation
+                 for details.
     :param kwargs: Similarly, additional keyword arguments that will be
-               passed on to the regular `plt.axhline` function.
+                   passed on to the regular `plt.axhline` function.
 
     .. plot::
         :include-source:
@@ -1509,6 +1560,80 @@ def axhline(y=0, *args, **kwargs):
     return ax.axhline(y, *args, **kwargs)
 
 
+def axvlines(xs, ymin=0, ymax=1, **kwargs):
+    """
+    Place many vertical lines on the axes at once.
+
+    This looks the same as calling `axvline` for each value, but all the
+    lines are put into one `LineCollection`, which is much faster to
+    create and draw when there are lots of lines.
+
+    :param xs: Data values on the x-axis to place the lines.
+    :type xs: list, np.ndarray
+    :param ymin: Where the lines start, as a fraction of the way from the
+                 bottom to the top of the axes.
+    :type ymin: float
+    :param ymax: Where the lines end, as a fraction of the way from the
+                 bottom to the top of the axes.
+    :type ymax: float
+    :param kwargs: Additional keyword arguments that will be passed on to
+                   the `LineCollection`, such as `color`, `linestyle`, or
+                   `linewidth`.
+    :return: The `LineCollection` holding the lines.
+
+    .. plot::
+        :include-source:
+
+        import numpy as np
+        import betterplotlib as bpl
+        bpl.set_style()
+
+        data = np.random.normal(0, 1, 10000)
+
+        bpl.hist(data)
+        bpl.axvlines(np.percentile(data, [16, 50, 84]), linestyle="--")
+    """
+    ax = get_axis()
+    return ax.axvlines(xs, ymin, ymax, **kwargs)
+
+
+def axhlines(ys, xmin=0, xmax=1, **kwargs):
+    """
+    Place many horizontal lines on the axes at once.
+
+    This looks the same as calling `axhline` for each value, but all the
+    lines are put into one `LineCollection`, which is much faster to
+    create and draw when there are lots of lines.
+
+    :param ys: Data values on the y-axis to place the lines.
+    :type ys: list, np.ndarray
+    :param xmin: Where the lines start, as a fraction of the way from the
+                 left to the right of the axes.
+    :type xmin: float
+    :param xmax: Where the lines end, as a fraction of the way from the
+                 left to the right of the axes.
+    :type xmax: float
+    :param kwargs: Additional keyword arguments that will be passed on to
+                   the `LineCollection`, such as `color`, `linestyle`, or
+                   `linewidth`.
+    :return: The `LineCollection` holding the lines.
+
+    .. plot::
+        :include-source:
+
+        import numpy as np
+        import betterplotlib as bpl
+        bpl.set_style()
+
+        xs = np.linspace(0, 10, 1000)
+
+        bpl.plot(xs, np.sin(xs) * np.exp(-0.1 * xs))
+        bpl.axhlines([-0.5, 0, 0.5], linestyle=":")
+    """
+    ax = get_axis()
+    return ax.axhlines(ys, xmin, xmax, **kwargs)
+
+
 def errorbar(*args, **kwargs):
     """
     Wrapper for the plt.errorbar() function.
@@ -1540,9 +1665,9 @@ def errorbar(*args, **kwargs):
         ax2 = fig.add_subplot(122, projection="bpl")  # bpl subplot.
 
         for ax in [ax1, ax2]:
-        ax.errorbar(xs,   ys,   xerr=xerr, yerr=yerr, label="set 1")
-        ax.errorbar(xs+1, ys+1, xerr=xerr, yerr=yerr, label="set 2")
-        ax.legend()
+            ax.errorbar(xs,   ys,   xerr=xerr, yerr=yerr, label="set 1")
+            ax.errorbar(xs+1, ys+1, xerr=xerr, yerr=yerr, label="set 2")
+            ax.legend()
         ax1.set_title("matplotlib")
         ax2.set_title("betterplotlib")
 
@@ -1562,13 +1687,13 @@ def twin_axis_simple(axis, lower_lim, upper_lim, label="", log=False):
     I haven't made will do that.
 
     :param axis: Where the new scaled axis will be placed. Must
-             either be "x" or "y".
+                 either be "x" or "y".
     :type axis: str
     :param lower_lim: Value to be put on the left/bottom of the newly
-              created axis.
+                      created axis.
     :type lower_lim: float
     :param upper_lim: Value to be put on the right/top of the newly
-              created axis.
+                      created axis.
     :type upper_lim: float
     :param label: The label to put on this new axis.
     :type label: str
@@ -1611,29 +1736,29 @@ def twin_axis(axis, new_ticks, label, old_to_new_func=None, new_to_old_func=None
     an arbitrary scale.
 
     :param axis: Whether the new axis labels will be on the "x" or "y" axis.
-             If "x" is chosen this will place the markers on the top
-             botder of the plot, while "y" will place the values on the
-             left border of the plot. "x" and "y" are the only
-             allowed values.
+                 If "x" is chosen this will place the markers on the top
+                 botder of the plot, while "y" will place the values on the
+                 left border of the plot. "x" and "y" are the only
+                 allowed values.
     :type axis: str
     :param new_ticks: List of of locations (in the new data values) to place
-              ticks. Any values outside the range of the plot
-              will be ignored.
+                      ticks. Any values outside the range of the plot
+                      will be ignored.
     :type new_ticks: list, np.ndarray
     :param label: The label given to the newly created axis.
     :type label: str
     :param old_to_new_func: Function that takes values on the original axis
-                and transforms them to corresponding values
-                on the soon-to-be created axis. Either this
-                parameter or `new_to_old_func` can be used, but
-                not both.
+                            and transforms them to corresponding values
+                            on the soon-to-be created axis. Either this
+                            parameter or `new_to_old_func` can be used, but
+                            not both.
     :param new_to_old_func: Function that takes values on the
-                soon-to-be-created axis and transforms them to
-                corresponding values on the original axis.
-                Either this parameter or `old_to_new_func` can
-                be used, but not both.
+                            soon-to-be-created axis and transforms them to
+                            corresponding values on the original axis.
+                            Either this parameter or `old_to_new_func` can
+                            be used, but not both.
     :return: New axis object that was created, containing the newly
-         created labels.
+             created labels.
 
     .. plot::
         :include-source:
@@ -1642,10 +1767,10 @@ def twin_axis(axis, new_ticks, label, old_to_new_func=None, new_to_old_func=None
         bpl.set_style()
 
         def square(x):
-        return x**2
+            return x**2
 
         def cubed(x):
-        return x**3
+            return x**3
 
         fig, ax = bpl.subplots(figsize=[5, 5], tight_layout=True)
         ax.set_limits(0, 10, 0, 10.0001)  # to avoid floating point errors
@@ -1678,14 +1803,14 @@ def twin_axis(axis, new_ticks, label, old_to_new_func=None, new_to_old_func=None
         bpl.set_style()
 
         def cube_root(x):
-        return x ** (1.0 / 3.0)
+            return x ** (1.0 / 3.0)
 
         fig, ax = bpl.subplots(figsize=[5, 5], tight_layout=True)
         ax.set_limits(0, 10, 0, 10.0001)  # to avoid floating point errors
         ax.add_labels("x", "y")
         ax.twin_axis("y", [0, 10, 30, 60, 100], "$y^2$", new_to_old_func=np.sqrt)
         ax.twin_axis(
-        "x", [0, 10, 100, 400, 1000], "$x^3$", new_to_old_func=cube_root
+            "x", [0, 10, 100, 400, 1000], "$x^3$", new_to_old_func=cube_root
         )
 
     This function will ignore values for the ticks that are outside the
@@ -1716,7 +1841,7 @@ def twin_axis(axis, new_ticks, label, old_to_new_func=None, new_to_old_func=None
 
 def shaded_density(
     xs,
-    ys,
+    ys=None,
     bin_size=None,
     smoothing=0,
     cmap="Greys",
@@ -1730,41 +1855,43 @@ def shaded_density(
     Is essentially a 2D histogram, but supports smoothing. Under the hood,
     this uses the  pcolormesh function in matplotlib.
 
-    :param xs: list of x values
+    :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+               is not passed.
     :type xs: list, ndarray
-    :param ys: list of y values
-    :type ys: list, ndarray
+    :param ys: list of y values. Leave this out to pass all the points in
+               `xs` as an (N, 2) array.
+    :type ys: list, ndarray, None
     :param bin_size: Bin size to use for the underlying 2D histogram. This
-             can either be a scalar, in which case the bin size will
-             be the same in both the x dimensions, or else a two
-             element list, where the first element will be the
-             bin size in the x dimension, and the second will be
-             the bin size in the y dimension.
+                     can either be a scalar, in which case the bin size will
+                     be the same in both the x dimensions, or else a two
+                     element list, where the first element will be the
+                     bin size in the x dimension, and the second will be
+                     the bin size in the y dimension.
     :type bin_size: int, float, list
     :param smoothing: Optional parameter that will smooth the shaded density.
-              Pass in a nonzero value, which will be the
-              standard deviation of the Gaussian kernel use to smooth
-              the histogram. When using this, often choosing smaller
-              bin sizes is advantageous to make a less grainy plot.
-              Has the same format as padding and bin_size, so different
-              smoothing kernels are possible in the x and y directions.
+                      Pass in a nonzero value, which will be the
+                      standard deviation of the Gaussian kernel use to smooth
+                      the histogram. When using this, often choosing smaller
+                      bin sizes is advantageous to make a less grainy plot.
+                      Has the same format as padding and bin_size, so different
+                      smoothing kernels are possible in the x and y directions.
     :type smoothing: int, float, list
     :param cmap: The colormap to use for the shading
     :type cmap: str
     :param weights: A list containing weights for each data point. If these
-            are not passed, all data points will be weighted
-            equally.
+                    are not passed, all data points will be weighted
+                    equally.
     :type weights: list, np.ndarray
     :param log_xy: Whether or not to do the smoothing and bin creation in log
-               space. This should be used if the plot will be done on
-               log-scaled axes.Can either be a single bool, in which case the
-               x and y scales will both be log (or not), or a two element
-               array, where the first is whether the x axis is log, and the
-               second is y. If this is used, the bin_size and smoothing
-               parameters will be interpreted as dex, rather than raw values.
+                   space. This should be used if the plot will be done on
+                   log-scaled axes.Can either be a single bool, in which case the
+                   x and y scales will both be log (or not), or a two element
+                   array, where the first is whether the x axis is log, and the
+                   second is y. If this is used, the bin_size and smoothing
+                   parameters will be interpreted as dex, rather than raw values.
     :type log: bool, list
     :param log_hist: Whether or not to use the log of the histogram values to
-             compute the shading, or just the values of the histogram.
+                     compute the shading, or just the values of the histogram.
     :type log_hist: bool
     :return: output of the pcolormesh function call.
 
@@ -1776,10 +1903,10 @@ def shaded_density(
         bpl.set_style()
 
         xs = np.concatenate(
-        [np.random.normal(3, 2, 1000), np.random.normal(7, 2, 1000)]
+            [np.random.normal(3, 2, 1000), np.random.normal(7, 2, 1000)]
         )
         ys = np.concatenate(
-        [np.random.normal(7, 2, 1000), np.random.normal(3, 2, 1000)]
+            [np.random.normal(7, 2, 1000), np.random.normal(3, 2, 1000)]
         )
 
         bpl.shaded_density(xs, ys, bin_size=0.01, smoothing=0.5, cmap="inferno")
@@ -1795,20 +1922,20 @@ def shaded_density(
         bpl.set_style()
 
         xs = np.concatenate(
-        [np.random.normal(3, 2, 1000), np.random.normal(7, 2, 1000)]
+            [np.random.normal(3, 2, 1000), np.random.normal(7, 2, 1000)]
         )
         ys = 10 ** np.concatenate(
-        [np.random.normal(7, 2, 1000), np.random.normal(3, 2, 1000)]
+            [np.random.normal(7, 2, 1000), np.random.normal(3, 2, 1000)]
         )
 
         fig, ax = bpl.subplots()
         bpl.shaded_density(
-        xs,
-        ys,
-        bin_size=0.01,
-        smoothing=0.5,
-        cmap="inferno",
-        log_xy=[False, True],
+            xs,
+            ys,
+            bin_size=0.01,
+            smoothing=0.5,
+            cmap="inferno",
+            log_xy=[False, True],
         )
         ax.log("y")
         bpl.set_limits(0, 10, 1, 1e10)
@@ -1817,14 +1944,7 @@ def shaded_density(
     """
     ax = get_axis()
     return ax.shaded_density(
-        xs,
-        ys,
-        bin_size,
-        smoothing,
-        cmap,
-        weights,
-        log_xy,
-        log_hist,
+        xs, ys, bin_size, smoothing, cmap, weights, log_xy, log_hist
     )
 
 
@@ -1833,12 +1953,12 @@ def log(axes, nice_format=True):
     Set the x and/or y axis to be log-scaled
 
     :param axes: which axes to log scale. Pass "x" for the x axis, "y" for the y
-             axis, or "both".
+                 axis, or "both".
     :type axees: str
     :param nice_format: whether to format numbers near 1 as regular numbers,
-                instead of exponential notation. For example, passing True
-                will show 1 as 1, while False will show 1 as 10^0. Defaults
-                to True.
+                        instead of exponential notation. For example, passing True
+                        will show 1 as 1, while False will show 1 as 10^0. Defaults
+                        to True.
     :type nice_format: bool
     :returns: None
 
@@ -1852,10 +1972,10 @@ def log(axes, nice_format=True):
         fig, axs = bpl.subplots(ncols=2, figsize=[12, 6])
 
         for ax, nice_format in zip(axs, [True, False]):
-        ax.log("both", nice_format)
-        ax.set_limits(1e-3, 1e3, 1e-3, 1e3)
-        ax.equal_scale()
-        ax.add_labels(title=f"nice_format = {str(nice_format)}")
+            ax.log("both", nice_format)
+            ax.set_limits(1e-3, 1e3, 1e-3, 1e3)
+            ax.equal_scale()
+            ax.add_labels(title=f"nice_format = {str(nice_format)}")
 
     """
     ax = get_axis()
@@ -1904,10 +2024,10 @@ def set_ticks(axis, ticks, labels=None, minor=False):
         bpl.set_ticks("x", [3, 5], ["b", "c"], minor=True)
         bpl.set_ticks("y", [1, 10])
         bpl.set_ticks(
-        "y",
-        [1, 2, 3, 4, 5, 6, 7, 8, 9],
-        ["", "2", "3", "", "5", "", "7", "", ""],
-        minor=True,
+            "y",
+            [1, 2, 3, 4, 5, 6, 7, 8, 9],
+            ["", "2", "3", "", "5", "", "7", "", ""],
+            minor=True,
         )
 
     """
@@ -1922,16 +2042,16 @@ def kde(xs, smoothing, norm=False, log=False, **kwargs):
     :param xs: The data to visualiza
     :type xs: list, ndarray
     :param smoothing: The smoothing to apply to each data point. If a single value
-              is supplied, that will be applied to all data points. You
-              can also supply a list with length equal to `xs` to use
-              different smoothing for each data point.
+                      is supplied, that will be applied to all data points. You
+                      can also supply a list with length equal to `xs` to use
+                      different smoothing for each data point.
     :type smoothing: float, list, ndarray
     :param norm: Whether to normalize the distribution so that integrates to 1.
     :type norm: bool
     :param log: Whether to do the KDE creation in log space. If this is used,
-            the value for `smoothing` will be interpreted as dex. If `norm` is
-            also used, the integration will be done in log space, meaning we
-            integrate dlogx rather than dx.
+                the value for `smoothing` will be interpreted as dex. If `norm` is
+                also used, the integration will be done in log space, meaning we
+                integrate dlogx rather than dx.
     :type log: bool
     :param kwargs: additional keyword arguments to pass to the `plot` function
 
@@ -1,14 +1,233 @@
+import functools
+
 from matplotlib.axes import Axes
 from matplotlib import colors as mpl_colors
-from matplotlib import path, rcParams, ticker
+from matplotlib import collections, path, rcParams, ticker
 import matplotlib.patheffects as PathEffects
-from scipy import optimize, integrate
 import numpy as np
 
 from . import colors
 from . import tools
 from . import type_checking
 
+# The sides of an axis that ticks and spines can be removed from. Users can pass
+# "all" as a shortcut for all of them.
+_ALL_SIDES = frozenset(("left", "right", "top", "bottom"))
+# the options for which axis labels can be removed
+_LABEL_AXES = frozenset(("both", "x", "y"))
+
+
+def _normalize_sides(sides):
+    """
+    Turn the sides passed to remove_ticks or remove_spines into a set.
+
+    :param sides: Sides of the axis, possibly including "all".
+    :return: frozenset of the sides, with "all" expanded and duplicates removed.
+    """
+    if "all" in sides:
+        return _ALL_SIDES
+    return frozenset(sides)
+
+
+# Where easy_add_text puts text for each location, as (x, y, horizontal
+# alignment, vertical alignment), with x and y in axes coordinates. The numbers
+# follow the layout of a keypad.
+_TEXT_LOCATIONS = {
+    1: (0.04, 0.04, "left", "bottom"),
+    2: (0.5, 0.04, "center", "bottom"),
+    3: (0.96, 0.04, "right", "bottom"),
+    4: (0.04, 0.5, "left", "center"),
+    5: (0.5, 0.5, "center", "center"),
+    6: (0.96, 0.5, "right", "center"),
+    7: (0.04, 0.96, "left", "top"),
+    8: (0.5, 0.96, "center", "top"),
+    9: (0.96, 0.96, "right", "top"),
+}
+# the names of each location can be used in place of the numbers
+_TEXT_LOCATIONS.update(
+    {
+        name: _TEXT_LOCATIONS[number]
+        for number, name in enumerate(
+            [
+                "lower left",
+                "lower center",
+                "lower right",
+                "center left",
+                "center",
+                "center right",
+                "upper left",
+                "upper center",
+                "upper right",
+            ],
+            start=1,
+        )
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _named_fill_cmap(name):
+    """
+    Build one of the special fill colormaps contour_scatter accepts by name.
+
+    These are cached, so repeated calls reuse the same colormap and its lookup
+    table. Use `_fill_cmap` to get a copy that's safe to hand to users.
+
+    :param name: "white", "background_grey", or "modified_greys".
+    :return: The colormap with that name.
+    :rtype: matplotlib.colors.Colormap
+    """
+    if name == "white":
+        # colormap with one color: white
+        return mpl_colors.ListedColormap(colors="white", N=1)
+    elif name == "background_grey":
+        # colormap with one color: the light grey used in backgrounds
+        return mpl_colors.ListedColormap(colors=colors.light_gray, N=1)
+    else:  # modified_greys
+        # make one that transitions from light grey to black
+        new_colors = [colors.light_gray, "black"]
+        return mpl_colors.LinearSegmentedColormap.from_list("mod_gray", new_colors)
+
+
+def _fill_cmap(fill_cmap):
+    """
+    Turn the `fill_cmap` passed to contour_scatter into a colormap.
+
+    The special names are replaced with a copy of their cached colormap, so
+    that modifying the colormap of one plot doesn't change later ones. Anything
+    else is returned unchanged, for matplotlib to handle.
+
+    :param fill_cmap: Name of a colormap, a colormap, or None.
+    :return: Colormap to use for the filled contours.
+    """
+    if isinstance(fill_cmap, str) and fill_cmap in (
+        "white",
+        "background_grey",
+        "modified_greys",
+    ):
+        return _named_fill_cmap(fill_cmap).copy()
+    return fill_cmap
+
+
+def _decode_location(location):
+    """
+    Get the position and alignment of text placed with easy_add_text.
+
+    :param location: Integer 1-9 or string describing the location.
+    :return: Tuple of x, y (in axes coordinates), horizontal alignment, and
+             vertical alignment.
+    """
+    try:
+        return _TEXT_LOCATIONS[location]
+    except (KeyError, TypeError):  # TypeError catches unhashable things
+        raise ValueError("loc was not specified properly.")
+
+
+# The levels drawn by the density contours if the user doesn't pick their own. The
+# zero level is always included, so the center region is filled.
+_DEFAULT_PERCENT_LEVELS = (0, 0.25, 0.5, 0.75, 0.95)
+
+
+def _contours_containing(points, lines):
+    """
+    Count how many of the closed contour lines each point is inside.
+
+    :param points: (N, 2) array of points.
+    :param lines: List of (M, 2) arrays of the vertices of each line.
+    :return: Number of lines each point is inside.
+    :rtype: np.ndarray
+    """
+    shapes_in = np.zeros(len(points), dtype=int)
+    for line in lines:
+        # make a closed shape with the line
+        polygon = path.Path(line, closed=True)
+        shapes_in += polygon.contains_points(points)
+    return shapes_in
+
+
+def _grid_cells(values, grid):
+    """
+    Find which cell of a grid each value is in.
+
+    Cell i is between grid[i] and grid[i + 1]. Values beyond either end of the
+    grid are put in the cell at that end. Evenly spaced grids (which the density
+    histograms always are) are handled with arithmetic rather than a search.
+
+    :param values: Values to find the cells of.
+    :type values: np.ndarray
+    :param grid: Increasing grid values, with at least two of them.
+    :type grid: np.ndarray
+    :return: Cell index of each value.
+    :rtype: np.ndarray
+    """
+    widths = np.diff(grid)
+    if np.allclose(widths, widths[0], rtol=1e-6, atol=0):
+        idx = tools._uniform_bin_indices(values, grid)[0]
+    else:
+        idx = np.searchsorted(grid, values, side="right") - 1
+    return np.clip(idx, 0, len(grid) - 2)
+
+
+def _contours_containing_on_grid(points, lines, x_cen, y_cen, hist, level):
+    """
+    Count how many of the contour lines of `hist` each point is inside, mod 2.
+
+    This gives the same result as `_contours_containing`, but is much faster for
+    lots of points. Contour lines only pass through grid cells whose corners
+    are on different sides of the level. Every point in any other cell is
+    inside the same shapes as the center of that cell, so only the cell
+    centers need the full point in polygon test. Only the points in cells the
+    contour passes through are tested individually.
+
+    :param points: (N, 2) array of points.
+    :param lines: Contour lines at `level`, as (M, 2) arrays of vertices.
+    :param x_cen: x values of the histogram grid.
+    :param y_cen: y values of the histogram grid.
+    :param hist: Histogram the contours were drawn from, with shape
+                 (len(y_cen), len(x_cen)).
+    :param level: The level the contour lines are at.
+    :return: Number of lines each point is inside, mod 2.
+    :rtype: np.ndarray
+    """
+    # Closing an open line (one that runs off the grid) adds a segment that can
+    # cross any cell, so those need the full test.
+    if len(x_cen) < 2 or len(y_cen) < 2:
+        return _contours_containing(points, lines) % 2
+    for line in lines:
+        if not np.array_equal(line[0], line[-1]):
+            return _contours_containing(points, lines) % 2
+
+    x_cen = np.asarray(x_cen)
+    y_cen = np.asarray(y_cen)
+
+    # find the cells with all four corners on the same side of the level
+    corners = [hist[:-1, :-1], hist[1:, :-1], hist[:-1, 1:], hist[1:, 1:]]
+    all_above = np.logical_and.reduce([c > level for c in corners])
+    all_below = np.logical_and.reduce([c < level for c in corners])
+    uniform_cells = all_above | all_below
+
+    # Get the cell each point is in. Points beyond the outermost grid values go
+    # into the cells at the edge. No lines pass between them and those cells.
+    x_idx = _grid_cells(points[:, 0], x_cen)
+    y_idx = _grid_cells(points[:, 1], y_cen)
+    in_uniform = uniform_cells[y_idx, x_idx]
+
+    parity = np.empty(len(points), dtype=int)
+    parity[~in_uniform] = _contours_containing(points[~in_uniform], lines) % 2
+
+    # test only the center of each uniform cell that has points in it
+    cell_ids = y_idx[in_uniform] * (len(x_cen) - 1) + x_idx[in_uniform]
+    unique_ids, inverse = np.unique(cell_ids, return_inverse=True)
+    cell_y, cell_x = np.divmod(unique_ids, len(x_cen) - 1)
+    centers = np.column_stack(
+        [
+            0.5 * (x_cen[cell_x] + x_cen[cell_x + 1]),
+            0.5 * (y_cen[cell_y] + y_cen[cell_y + 1]),
+        ]
+    )
+    parity[in_uniform] = (_contours_containing(centers, lines) % 2)[inverse]
+    return parity
+
 
 class Axes_bpl(Axes):
     name = "bpl"
@@ -95,13 +314,8 @@ class Axes_bpl(Axes):
             ax0.set_title("removed top/right ticks")
             ax1.set_title("removed all ticks")
         """
-        # If they want to remove all spines, turn that into workable infomation
-        ticks_to_remove = set(ticks_to_remove)  # to remove duplicates
-        if "all" in ticks_to_remove:
-            # have to do weirdness since its a set
-            ticks_to_remove.remove("all")
-            for tick in ["left", "right", "top", "bottom"]:
-                ticks_to_remove.add(tick)
+        # If they want to remove all ticks, turn that into workable infomation
+        ticks_to_remove = _normalize_sides(ticks_to_remove)
 
         # matplotlib only allows setting which axes the ticks are on, so figure
         # that out and set the ticks to only be on the desired axes.
@@ -163,11 +377,7 @@ class Axes_bpl(Axes):
 
         """
         # If they want to remove all spines, turn that into workable infomation
-        spines_to_remove = set(spines_to_remove)  # to remove duplicates
-        if "all" in spines_to_remove:
-            spines_to_remove.remove("all")
-            for spine in ["left", "right", "top", "bottom"]:
-                spines_to_remove.add(spine)
+        spines_to_remove = _normalize_sides(spines_to_remove)
 
         # remove the spines
         for spine in spines_to_remove:
@@ -196,6 +406,12 @@ class Axes_bpl(Axes):
                      plt.scatter function. These will typically be the x and y
                      lists.
         :param kwargs: keyword arguments that will be passed on to plt.scatter.
+        :keyword rasterize_threshold: Scatter plots with more points than this
+                                      are rasterized, which keeps vector
+                                      output (like pdf) small and quick to
+                                      render. The axes, labels, etc. stay as
+                                      vector graphics. Defaults to 1000. Pass
+                                      `rasterized` directly to override this.
         :return: the output of the plt.scatter call is returned directly.
 
         .. plot::
@@ -229,6 +445,7 @@ class Axes_bpl(Axes):
         # already exist, but won't overwrite anything.
         # use the function we defined to get the proper alpha value.
         kwargs.setdefault("alpha", tools._alpha(len(args[0])))
+        rasterize_threshold = kwargs.pop("rasterize_threshold", 1000)
 
         # we want to make the points in the legend opaque always. To do this
         # we plot nans with all the same parameters, but with alpha of one.
@@ -253,6 +470,12 @@ class Axes_bpl(Axes):
             # in the main plotting we don't want to have a label, so we pop it.
             kwargs.pop("label")
 
+        # Vector formats store every point separately, which makes big scatter
+        # plots huge and slow to render. Rasterize those, but not the legend
+        # marker above or anything else on the axis.
+        if len(args[0]) > rasterize_threshold:
+            kwargs.setdefault("rasterized", True)
+
         # we then plot the main data
         return super(Axes_bpl, self).scatter(*args, **kwargs)
 
@@ -392,8 +615,10 @@ class Axes_bpl(Axes):
         if "bins" not in kwargs:
             if "bin_size" not in kwargs:
                 kwargs["bin_size"] = tools.rounded_bin_width(args[0])
+            # np.min and np.max are single vectorized passes, unlike the
+            # builtins, which iterate over the array one element at a time.
             kwargs["bins"] = tools._binning(
-                min(args[0]), max(args[0]), kwargs.pop("bin_size")
+                np.min(args[0]), np.max(args[0]), kwargs.pop("bin_size")
             )
 
         # plot the histogram, and keep the results
@@ -480,9 +705,13 @@ class Axes_bpl(Axes):
             ax2.plot(xs, ys)
             ax2.set_limits(0, 2*np.pi, -1.1, 1.1)
         """
-        # Any None values won't change the plot any.
-        self.set_xlim([x_min, x_max], **kwargs)
-        self.set_ylim([y_min, y_max], **kwargs)
+        # Any None values won't change the plot any. If neither limit on an axis
+        # was given, skip that axis entirely, since even setting [None, None]
+        # turns off autoscaling and triggers the limit change callbacks.
+        if x_min is not None or x_max is not None:
+            self.set_xlim([x_min, x_max], **kwargs)
+        if y_min is not None or y_max is not None:
+            self.set_ylim([y_min, y_max], **kwargs)
 
     def add_text(
         self, x, y, text, coords="data", border_color=None, border_linewidth=3, **kwargs
@@ -633,7 +862,7 @@ class Axes_bpl(Axes):
 
         """
         # validate their input
-        if labels_to_remove not in ["both", "x", "y"]:
+        if not isinstance(labels_to_remove, str) or labels_to_remove not in _LABEL_AXES:
             raise ValueError('Please pass in either "x", "y", or "both".')
 
         # then set the tick parameters.
@@ -720,13 +949,11 @@ class Axes_bpl(Axes):
             title = leg.get_title()
             title.set_fontsize(kwargs["fontsize"] * 1.2)
 
-        # adjust the size of points within the legend
+        # adjust the size of points within the legend. Only the handles for
+        # scatter plots have sizes, so skip the rest without raising errors.
         for handle in leg.legend_handles:
-            # if it's not a handle for a scatter plot, setting the sizes will fail
-            try:
+            if hasattr(handle, "set_sizes"):
                 handle.set_sizes([100])
-            except:
-                continue
 
         if leg is not None:
             # turn the background into whatever color it needs to be
@@ -911,62 +1138,49 @@ class Axes_bpl(Axes):
         ):
             raise ValueError("This function controls the alignment. Do not pass it in.")
 
-        # then check each different case, and set the parameters we want to use.
-        if location == 1 or location == "lower left":
-            x_value = 0.04
-            y_value = 0.04
-            kwargs["horizontalalignment"] = "left"
-            kwargs["verticalalignment"] = "bottom"
-        elif location == 2 or location == "lower center":
-            x_value = 0.5
-            y_value = 0.04
-            kwargs["horizontalalignment"] = "center"
-            kwargs["verticalalignment"] = "bottom"
-        elif location == 3 or location == "lower right":
-            x_value = 0.96
-            y_value = 0.04
-            kwargs["horizontalalignment"] = "right"
-            kwargs["verticalalignment"] = "bottom"
-        elif location == 4 or location == "center left":
-            x_value = 0.04
-            y_value = 0.5
-            kwargs["horizontalalignment"] = "left"
-            kwargs["verticalalignment"] = "center"
-        elif location == 5 or location == "center":
-            x_value = 0.5
-            y_value = 0.5
-            kwargs["horizontalalignment"] = "center"
-            kwargs["verticalalignment"] = "center"
-        elif location == 6 or location == "center right":
-            x_value = 0.96
-            y_value = 0.5
-            kwargs["horizontalalignment"] = "right"
-            kwargs["verticalalignment"] = "center"
-        elif location == 7 or location == "upper left":
-            x_value = 0.04
-            y_value = 0.96
-            kwargs["horizontalalignment"] = "left"
-            kwargs["verticalalignment"] = "top"
-        elif location == 8 or location == "upper center":
-            x_value = 0.5
-            y_value = 0.96
-            kwargs["horizontalalignment"] = "center"
-            kwargs["verticalalignment"] = "top"
-        elif location == 9 or location == "upper right":
-            x_value = 0.96
-            y_value = 0.96
-            kwargs["horizontalalignment"] = "right"
-            kwargs["verticalalignment"] = "top"
-        else:
-            raise ValueError("loc was not specified properly.")
+        # then look up the position and alignment for this location.
+        x_value, y_value, ha, va = _decode_location(location)
+        kwargs["horizontalalignment"] = ha
+        kwargs["verticalalignment"] = va
 
         # then add the text.
         return self.add_text(x_value, y_value, text, coords="axes", **kwargs)
 
+    def easy_add_texts(self, texts_and_locations, **kwargs):
+        """
+        Adds several pieces of text in common spots at once.
+
+        This is the same as calling `easy_add_text` for each piece of text, with
+        the same keyword arguments applied to all of them.
+
+        :param texts_and_locations: List of (text, location) pairs. The locations
+                                    are specified the same way as in
+                                    `easy_add_text`.
+        :type texts_and_locations: list
+        :param kwargs: Additional keyword arguments that will be passed on to
+                       `add_text` for every piece of text. As in `easy_add_text`,
+                       the alignment and `coords` can't be set.
+        :return: list of the text objects that were added.
+
+        .. plot::
+            :include-source:
+
+            import betterplotlib as bpl
+            bpl.set_style()
+
+            bpl.easy_add_texts(
+                [("lower left", 1), ("center", 5), ("upper right", 9)], fontsize=24
+            )
+        """
+        return [
+            self.easy_add_text(text, location, **kwargs)
+            for text, location in texts_and_locations
+        ]
+
     def _density_contour_core(
         self,
         xs,
-        ys,
+        ys=None,
         bin_size=None,
         percent_levels=None,
         smoothing=0,
@@ -980,10 +1194,12 @@ class Axes_bpl(Axes):
         The underlying function to do both filled and unfilled contours. Call
         `density_contour` or `density_contourf` instead of this.
 
-        :param xs: List of x values
+        :param xs: List of x values, or an (N, 2) array of x, y points if `ys`
+                   is not passed.
         :type xs: list, np.ndarray
-        :param ys: List of y values
-        :type ys: list, np.ndarray
+        :param ys: List of y values. Leave this out to pass all the points in
+                   `xs` as an (N, 2) array.
+        :type ys: list, np.ndarray, None
         :param bin_size: Bin size to use for the underlying 2D histogram. This
                          can either be a scalar, in which case the bin size will
                          be the same in both the x dimensions, or else a two
@@ -1030,18 +1246,30 @@ class Axes_bpl(Axes):
                        matplotlib contour function.
         :return: output of the matplotlib.contour function.
         """
+        x_cen, y_cen, hist = self._density_hist(
+            xs, ys, bin_size, smoothing, weights, log
+        )
+        return self._draw_density_contours(
+            x_cen, y_cen, hist, percent_levels, labels, filled, **kwargs
+        )
+
+    def _density_hist(self, xs, ys, bin_size, smoothing, weights, log):
+        """
+        Make the 2D histogram that density contours are drawn from.
+
+        The parameters are the same as in `_density_contour_core`.
+
+        :return: The bin centers in x and y, and the histogram itself, in the
+                 order matplotlib's contour functions expect them.
+        """
+        xs, ys = tools._data_arrays(*tools._unpack_points(xs, ys))
         # error check weird error matplotlib has when all x and y data are same.
-        if len(set(xs)) == len(set(ys)) == 1 and smoothing == 0:
+        if tools._all_same(xs) and tools._all_same(ys) and smoothing == 0:
             raise ValueError(
                 "All points are identical. This breaks matplotlib "
                 "contours for some reason. "
                 "Try other data, or smooth."
             )
-        # levels is set by this function, so it can't be in there
-        if "levels" in kwargs:
-            raise ValueError(
-                "The levels parameter is set by this function. " "Do not pass it in. "
-            )
         # if smoothing is not specified, we still want some padding on the
         # outside so the contours aren't cut off.
         if smoothing == 0:
@@ -1065,17 +1293,34 @@ class Axes_bpl(Axes):
         )
         x_cen = tools.bin_centers(x_e)
         y_cen = tools.bin_centers(y_e)
+        return x_cen, y_cen, hist
+
+    def _draw_density_contours(
+        self, x_cen, y_cen, hist, percent_levels, labels, filled, **kwargs
+    ):
+        """
+        Draw contours (filled or not) on a histogram made by `_density_hist`.
+
+        The other parameters are the same as in `_density_contour_core`.
+
+        :return: The output of the matplotlib contour or contourf call.
+        """
+        # levels is set by this function, so it can't be in there
+        if "levels" in kwargs:
+            raise ValueError(
+                "The levels parameter is set by this function. " "Do not pass it in. "
+            )
 
         # then get the levels of the contours
         if percent_levels is None:
-            percent_levels = [0, 0.25, 0.5, 0.75, 0.95]
+            percent_levels = _DEFAULT_PERCENT_LEVELS
         else:
             not_list_msg = "Percent_levels needs to be a numeric list."
             percent_levels = type_checking.numeric_list_1d(percent_levels, not_list_msg)
             # add zero level to have center region full
             percent_levels = np.insert(percent_levels, 0, 0)
 
-        levels = tools.percentile_level(hist.flatten(), percent_levels)
+        levels = tools.percentile_level(hist.ravel(), percent_levels)
         # then check that the levels are increasing and without duplicates
         if len(set(levels)) < len(levels):
             raise ValueError(
@@ -1118,7 +1363,7 @@ class Axes_bpl(Axes):
     def density_contour(
         self,
         xs,
-        ys,
+        ys=None,
         bin_size=None,
         percent_levels=None,
         smoothing=0,
@@ -1137,10 +1382,12 @@ class Axes_bpl(Axes):
         These contours are just lines, not filled regions. Check out
         `density_contourf()` for that.
 
-        :param xs: list of x values
+        :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+                   is not passed.
         :type xs: list, ndarray
-        :param ys: list of y values
-        :type ys: list, ndarray
+        :param ys: list of y values. Leave this out to pass all the points in
+                   `xs` as an (N, 2) array.
+        :type ys: list, ndarray, None
         :param bin_size: Bin size to use for the underlying 2D histogram. This
                          can either be a scalar, in which case the bin size will
                          be the same in both the x dimensions, or else a two
@@ -1255,7 +1502,7 @@ class Axes_bpl(Axes):
     def density_contourf(
         self,
         xs,
-        ys,
+        ys=None,
         bin_size=None,
         percent_levels=None,
         smoothing=0,
@@ -1273,10 +1520,12 @@ class Axes_bpl(Axes):
         These contours are just filled regions with no lines. Check out
         `density_contour()` for that.
 
-        :param xs: list of x values
+        :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+                   is not passed.
         :type xs: list, ndarray
-        :param ys: list of y values
-        :type ys: list, ndarray
+        :param ys: list of y values. Leave this out to pass all the points in
+                   `xs` as an (N, 2) array.
+        :type ys: list, ndarray, None
         :param bin_size: Bin size to use for the underlying 2D histogram. This
                          can either be a scalar, in which case the bin size will
                          be the same in both the x dimensions, or else a two
@@ -1391,7 +1640,7 @@ class Axes_bpl(Axes):
     def contour_scatter(
         self,
         xs,
-        ys,
+        ys=None,
         bin_size=None,
         percent_levels=None,
         smoothing=0,
@@ -1401,6 +1650,7 @@ class Axes_bpl(Axes):
         scatter_kwargs=None,
         contour_kwargs=None,
         contourf_kwargs=None,
+        scatter_max_points=None,
     ):
         """
         Create a contour plot with scatter points in the sparse regions.
@@ -1424,10 +1674,12 @@ class Axes_bpl(Axes):
         check which of the points are outside of this contour. Only the points
         that are outside are plotted.
 
-        :param xs: list of x values
+        :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+                   is not passed.
         :type xs: list, ndarray
-        :param ys: list of y values
-        :type ys: list, ndarray
+        :param ys: list of y values. Leave this out to pass all the points in
+                   `xs` as an (N, 2) array.
+        :type ys: list, ndarray, None
         :param bin_size: Bin size to use for the underlying 2D histogram. This
                          can either be a scalar, in which case the bin size will
                          be the same in both the x dimensions, or else a two
@@ -1480,8 +1732,16 @@ class Axes_bpl(Axes):
         :type contour_kwargs: dict
         :param contourf_kwargs: Dictionary of additional parameters that will be
                                 passed to the underlying matplotlib contourf
-                                function.
+                                function. If this sets `alpha` to 0, the filled
+                                contours are skipped entirely.
         :type contourf_kwargs: dict
+        :param scatter_max_points: The most points to scatter in the outer
+                                   regions. If there are more than this, a
+                                   random subset of them is plotted, which can
+                                   make plots of very large datasets much faster
+                                   to draw. The same data always gives the same
+                                   subset. The default of None plots them all.
+        :type scatter_max_points: int
 
         Examples
 
@@ -1722,18 +1982,18 @@ class Axes_bpl(Axes):
 
             rad1 = np.random.normal(10, 0.75, 10000)
             theta1 = np.random.uniform(0, 2 * np.pi, 10000)
-            x1 = [r * np.cos(t) for r, t in zip(rad1, theta1)]
-            y1 = [r * np.sin(t) for r, t in zip(rad1, theta1)]
+            x1 = rad1 * np.cos(theta1)
+            y1 = rad1 * np.sin(theta1)
 
             rad2 = np.random.normal(20, 0.75, 20000)
             theta2 = np.random.uniform(0, 2 * np.pi, 20000)
-            x2 = [r * np.cos(t) for r, t in zip(rad2, theta2)]
-            y2 = [r * np.sin(t) for r, t in zip(rad2, theta2)]
+            x2 = rad2 * np.cos(theta2)
+            y2 = rad2 * np.sin(theta2)
 
             rad3 = np.random.normal(12, 0.75, 12000)
             theta3 = np.random.uniform(0, 2 * np.pi, 12000)
-            x3 = [r * np.cos(t) + 10 for r, t in zip(rad3, theta3)]
-            y3 = [r * np.sin(t) + 10 for r, t in zip(rad3, theta3)]
+            x3 = rad3 * np.cos(theta3) + 10
+            y3 = rad3 * np.sin(theta3) + 10
 
             x4 = np.random.uniform(-20, 20, 3500)
             y4 = x4 + np.random.normal(0, 0.5, 3500)
@@ -1749,6 +2009,8 @@ class Axes_bpl(Axes):
             ax.equal_scale()
         """
 
+        if scatter_max_points is not None and scatter_max_points < 0:
+            raise ValueError("`scatter_max_points` must be non-negative.")
         if scatter_kwargs is None:
             scatter_kwargs = dict()
         if contour_kwargs is None:
@@ -1757,18 +2019,7 @@ class Axes_bpl(Axes):
             contourf_kwargs = dict()
 
         # determine what our colormap for the fill will be
-        if fill_cmap == "white":
-            # colormap with one color: white
-            fill_cmap = mpl_colors.ListedColormap(colors="white", N=1)
-        elif fill_cmap == "background_grey":
-            # colormap with one color: the light grey used in backgrounds
-            fill_cmap = mpl_colors.ListedColormap(colors=colors.light_gray, N=1)
-        elif fill_cmap == "modified_greys":
-            # make one that transitions from light grey to black
-            new_colors = [colors.light_gray, "black"]
-            fill_cmap = mpl_colors.LinearSegmentedColormap.from_list(
-                "mod_gray", new_colors
-            )
+        fill_cmap = _fill_cmap(fill_cmap)
 
         # then we can set a bunch of default parameters for the contours
         contour_kwargs.setdefault("linewidths", 2)
@@ -1776,26 +2027,41 @@ class Axes_bpl(Axes):
         if "colors" not in contour_kwargs:
             contour_kwargs.setdefault("cmap", "viridis")
 
+        # If the points came packed in an (N, 2) array, they're already in the
+        # shape needed to check which are inside the contours below.
+        packed_points = xs if ys is None else None
+        xs, ys = tools._data_arrays(*tools._unpack_points(xs, ys))
+
+        # The filled contours and the contour lines are drawn from the same
+        # histogram, so we only need to make it once.
+        x_cen, y_cen, hist = self._density_hist(
+            xs, ys, bin_size, smoothing, weights, log=False
+        )
+
         # we can then go ahead and plot the filled contours, then the contour lines
         if fill_cmap is not None:
-            self.density_contourf(
-                xs,
-                ys,
-                bin_size=bin_size,
-                percent_levels=percent_levels,
-                smoothing=smoothing,
-                weights=weights,
-                cmap=fill_cmap,
-                **contourf_kwargs,
-            )
-        contours = self.density_contour(
-            xs,
-            ys,
-            bin_size=bin_size,
-            percent_levels=percent_levels,
-            smoothing=smoothing,
-            weights=weights,
+            # don't let user use the labels param here like they can in contour
+            if "labels" in contourf_kwargs:
+                raise ValueError("Filled contours cannot have labels.")
+            # fully transparent fills wouldn't be seen, so don't draw them
+            if contourf_kwargs.get("alpha") != 0:
+                self._draw_density_contours(
+                    x_cen,
+                    y_cen,
+                    hist,
+                    percent_levels,
+                    labels=False,
+                    filled=True,
+                    cmap=fill_cmap,
+                    **contourf_kwargs,
+                )
+        contours = self._draw_density_contours(
+            x_cen,
+            y_cen,
+            hist,
+            percent_levels,
             labels=labels,
+            filled=False,
             **contour_kwargs,
         )
 
@@ -1806,23 +2072,42 @@ class Axes_bpl(Axes):
         # each point is inside. We only do this if the user actually wants to
         # plot these points
         if scatter_kwargs.get("s") != 0:
-            shapes_in = np.zeros(len(xs))
-            for line in contours.allsegs[0]:  # zero index is lowest level
-                # make a closed shape with the line
-                polygon = path.Path(line, closed=True)
-                shapes_in += polygon.contains_points(list(zip(xs, ys)))
+            # The multiple indexing below is only supported for numpy arrays, not
+            # Python lists, so convert our values to that first. We also pack the
+            # points into one (N, 2) array once, rather than for every contour.
+            xs = np.asarray(xs)
+            ys = np.asarray(ys)
+            if packed_points is None:
+                points = np.column_stack([xs, ys])
+            else:
+                points = np.asarray(packed_points)
+            shapes_in = _contours_containing_on_grid(
+                points,
+                contours.allsegs[0],  # zero index is lowest level
+                x_cen,
+                y_cen,
+                hist,
+                contours.levels[0],
+            )
 
             # the ones that need to be hidden are inside an odd number of
             # shapes. This shounds weird, but actually works. If we have a ring
             # of points, the outliers in the middle will be inside the outermost
             # and innermost contours, so they are inside two shapes. We want to
             # plot these. So we plot the ones that are divisible by two.
-            plot_idx = np.where(shapes_in % 2 == 0)
-
-            # We then get these elements. The multiple indexing is only supported for
-            # numpy arrays, not Python lists, so convert our values to that first.
-            outside_xs = np.array(xs)[plot_idx]
-            outside_ys = np.array(ys)[plot_idx]
+            plot_idx = shapes_in % 2 == 0
+
+            # We then get these elements, keeping only some of them if the user
+            # asked us to limit the number of points.
+            outside_idx = np.flatnonzero(plot_idx)
+            if scatter_max_points is not None and len(outside_idx) > scatter_max_points:
+                # fixed seed so the same data always gives the same plot
+                rng = np.random.RandomState(0)
+                outside_idx = rng.choice(outside_idx, scatter_max_points, replace=False)
+                # keep the original drawing order
+                outside_idx.sort()
+            outside_xs = xs[outside_idx]
+            outside_ys = ys[outside_idx]
 
             # now we can do our scatterplot.
             scatter_kwargs.setdefault("alpha", 1.0)
@@ -1834,7 +2119,7 @@ class Axes_bpl(Axes):
 
         return contours
 
-    def data_ticks(self, x_data, y_data, extent=0.015, *args, **kwargs):
+    def data_ticks(self, x_data, y_data, extent=0.015, **kwargs):
         """
         Puts tiny ticks on the axis borders making the location of each point.
 
@@ -1853,11 +2138,21 @@ class Axes_bpl(Axes):
                        default case, the y ticks won't cover 2% of the axis, but
                        again will be the same physical size as the x ticks.
         :type extent: float
-        :param args: Additional arguments to pass to the `axvline` and `axhline`
-                     functions, which is what is used to make each tick.
-        :param kwargs: Additional keyword arguments to pass to the `axvline` and
-                       `axhline` functions. `color` is an important one here,
-                       and it defaults to `almost_black` here.
+        :param kwargs: Additional keyword arguments to pass to the `axvlines`
+                       and `axhlines` functions, which are used to make the
+                       ticks. These go to a `LineCollection`, so options that
+                       only `Line2D` has (like `marker`, `drawstyle`, or
+                       `solid_capstyle`) aren't accepted. Use `capstyle` to
+                       change the ends of the ticks. `color` is an important one
+                       here, and it defaults to `almost_black` here.
+        :return: The `LineCollection`s holding the x and y ticks. Versions up
+                 to 1.12.9 returned None.
+        :rtype: tuple
+
+        The ticks add the data values to the data limits, so if nothing else is
+        on the axes the limits are the data range plus the usual margins on
+        each axis. Up to version 1.12.9 each tick was its own `axvline` or
+        `axhline`, which could leave the limits slightly different from this.
 
 
         Example
@@ -1877,16 +2172,19 @@ class Axes_bpl(Axes):
         """
         kwargs.setdefault("color", colors.almost_black)
         kwargs.setdefault("linewidth", 0.5)
+        # match the end caps of the lines axvline and axhline would make
+        kwargs.setdefault("capstyle", rcParams["lines.solid_capstyle"])
 
-        for x in x_data:
-            self.axvline(x, ymin=0, ymax=extent, *args, **kwargs)
+        # The ticks on each axis all go into one LineCollection, rather than
+        # making a separate line for each one, which is slow for lots of data.
+        x_ticks = self.axvlines(x_data, 0, extent, **kwargs)
 
-        # Since the matplotlib command to ax(h/v)line uses an extent based on
-        # percentage of the way to the end, to get the same physical size for
-        # both axes, we have to scale based on the size of the axes
+        # Since the ticks use an extent based on percentage of the way to the
+        # end, to get the same physical size for both axes, we have to scale
+        # based on the size of the axes
         h_extent = (self.bbox.height / self.bbox.width) * extent
-        for y in y_data:
-            self.axhline(y, xmin=0, xmax=h_extent, *args, **kwargs)
+        y_ticks = self.axhlines(y_data, 0, h_extent, **kwargs)
+        return x_ticks, y_ticks
 
     def plot(self, *args, **kwargs):
         """
@@ -1941,6 +2239,8 @@ class Axes_bpl(Axes):
         """
         Place a vertical line at some point on the axes.
 
+        To place many lines at once, `axvlines` is much faster.
+
         :param x: Data value on the x-axis to place the line.
         :type x: float
         :param args: Additional parameters that will be passed on the the
@@ -1981,6 +2281,8 @@ class Axes_bpl(Axes):
         """
         Place a horizontal line at some point on the axes.
 
+        To place many lines at once, `axhlines` is much faster.
+
         :param y: Data value on the y-axis to place the line.
         :type y: float
         :param args: Additional parameters that will be passed on the the
@@ -2017,6 +2319,120 @@ class Axes_bpl(Axes):
 
         return super(Axes_bpl, self).axhline(y, *args, **kwargs)
 
+    def axvlines(self, xs, ymin=0, ymax=1, **kwargs):
+        """
+        Place many vertical lines on the axes at once.
+
+        This looks the same as calling `axvline` for each value, but all the
+        lines are put into one `LineCollection`, which is much faster to
+        create and draw when there are lots of lines.
+
+        :param xs: Data values on the x-axis to place the lines.
+        :type xs: list, np.ndarray
+        :param ymin: Where the lines start, as a fraction of the way from the
+                     bottom to the top of the axes.
+        :type ymin: float
+        :param ymax: Where the lines end, as a fraction of the way from the
+                     bottom to the top of the axes.
+        :type ymax: float
+        :param kwargs: Additional keyword arguments that will be passed on to
+                       the `LineCollection`, such as `color`, `linestyle`, or
+                       `linewidth`.
+        :return: The `LineCollection` holding the lines.
+
+        .. plot::
+            :include-source:
+
+            import numpy as np
+            import betterplotlib as bpl
+            bpl.set_style()
+
+            data = np.random.normal(0, 1, 10000)
+
+            bpl.hist(data)
+            bpl.axvlines(np.percentile(data, [16, 50, 84]), linestyle="--")
+        """
+        segments = self._axis_line_segments(xs, ymin, ymax, vertical=True)
+        return self._add_axis_lines(segments, self.get_xaxis_transform(), kwargs)
+
+    def axhlines(self, ys, xmin=0, xmax=1, **kwargs):
+        """
+        Place many horizontal lines on the axes at once.
+
+        This looks the same as calling `axhline` for each value, but all the
+        lines are put into one `LineCollection`, which is much faster to
+        create and draw when there are lots of lines.
+
+        :param ys: Data values on the y-axis to place the lines.
+        :type ys: list, np.ndarray
+        :param xmin: Where the lines start, as a fraction of the way from the
+                     left to the right of the axes.
+        :type xmin: float
+        :param xmax: Where the lines end, as a fraction of the way from the
+                     left to the right of the axes.
+        :type xmax: float
+        :param kwargs: Additional keyword arguments that will be passed on to
+                       the `LineCollection`, such as `color`, `linestyle`, or
+                       `linewidth`.
+        :return: The `LineCollection` holding the lines.
+
+        .. plot::
+            :include-source:
+
+            import numpy as np
+            import betterplotlib as bpl
+            bpl.set_style()
+
+            xs = np.linspace(0, 10, 1000)
+
+            bpl.plot(xs, np.sin(xs) * np.exp(-0.1 * xs))
+            bpl.axhlines([-0.5, 0, 0.5], linestyle=":")
+        """
+        segments = self._axis_line_segments(ys, xmin, xmax, vertical=False)
+        return self._add_axis_lines(segments, self.get_yaxis_transform(), kwargs)
+
+    @staticmethod
+    def _axis_line_segments(values, lower, upper, vertical):
+        """
+        Make the segments for lines spanning part of the axes at data values.
+
+        :param values: Data values to place the lines at.
+        :param lower: Start of the lines, as a fraction of the axes.
+        :param upper: End of the lines, as a fraction of the axes.
+        :param vertical: Whether the lines are vertical (placed at x values) or
+                         horizontal (placed at y values).
+        :return: (N, 2, 2) array of line segments.
+        """
+        # index of the coordinate the data values go in, and the other one
+        along, across = (0, 1) if vertical else (1, 0)
+        values = np.asarray(values, dtype=float)
+        segments = np.empty((len(values), 2, 2))
+        segments[:, :, along] = values[:, np.newaxis]
+        segments[:, 0, across] = lower
+        segments[:, 1, across] = upper
+        return segments
+
+    def _add_axis_lines(self, segments, transform, kwargs):
+        """
+        Add lines made by `_axis_line_segments` to the axes as one collection.
+
+        :param segments: (N, 2, 2) array of line segments.
+        :param transform: Blended transform from `get_xaxis_transform` or
+                          `get_yaxis_transform`, which puts the data values in
+                          data coordinates and the extent in axes coordinates.
+        :param kwargs: Keyword arguments to pass on to the `LineCollection`.
+        :return: The `LineCollection` holding the lines.
+        """
+        # Use the same default color as axvline and axhline. LineCollection
+        # doesn't know the "c" shorthand, so translate that if it's used.
+        if "c" in kwargs:
+            kwargs["color"] = kwargs.pop("c")
+        kwargs.setdefault("color", colors.almost_black)
+
+        lines = collections.LineCollection(segments, transform=transform, **kwargs)
+        self.add_collection(lines)
+        return lines
+
     def errorbar(self, *args, **kwargs):
         """
         Wrapper for the plt.errorbar() function.
@@ -2309,21 +2725,38 @@ class Axes_bpl(Axes):
                     tick_locs_in_old.append(old_data_loc)
                     new_ticks_good.append(new_value)
         else:
-            for new_value in new_ticks:
-                # determine the value on the original axis corresponding to
-                # each tick. Since we have the function transforming the old
-                # ticks to the new ones, we have to invert it
-                # define a function to minimize so scipy can work.
-                def minimize(x):
-                    return abs(old_to_new_func(x) - new_value)
-
-                # ignore numpy warnings here, everything is fine.
-                with np.errstate(all="ignore"):
-                    old_data_loc = optimize.minimize_scalar(minimize).x
-                    # then check if it's within the original axis range
-                    if old_min <= old_data_loc <= old_max:
-                        tick_locs_in_old.append(old_data_loc)
-                        new_ticks_good.append(new_value)
+            # Since we have the function transforming the old ticks to the new
+            # ones, we have to invert it. If it works on arrays, we can do that
+            # for all the ticks at once.
+            old_scale = self.get_yscale() if axis == "y" else self.get_xscale()
+            old_data_locs = tools._invert_monotonic(
+                old_to_new_func,
+                new_ticks,
+                old_min,
+                old_max,
+                log=old_scale == "log" and old_min > 0 and old_max > 0,
+            )
+            if old_data_locs is None:
+                # scipy.optimize is slow to import, so only load it when needed
+                from scipy import optimize
+
+                old_data_locs = []
+                for new_value in new_ticks:
+                    # determine the value on the original axis corresponding to
+                    # each tick. define a function to minimize so scipy can work.
+                    def minimize(x):
+                        return abs(old_to_new_func(x) - new_value)
+
+                    # ignore numpy warnings here, everything is fine.
+                    with np.errstate(all="ignore"):
+                        old_data_locs.append(optimize.minimize_scalar(minimize).x)
+
+            for new_value, old_data_loc in zip(new_ticks, old_data_locs):
+                # then check if it's within the original axis range. Values the
+                # function never reaches are NaN, which fail this too.
+                if old_min <= old_data_loc <= old_max:
+                    tick_locs_in_old.append(old_data_loc)
+                    new_ticks_good.append(new_value)
 
         # then put the ticks at the locations of the old data, but label them
         # with the value of the transformed data.
@@ -2335,7 +2768,7 @@ class Axes_bpl(Axes):
     def shaded_density(
         self,
         xs,
-        ys,
+        ys=None,
         bin_size=None,
         smoothing=0,
         cmap="Greys",
@@ -2349,10 +2782,12 @@ class Axes_bpl(Axes):
         Is essentially a 2D histogram, but supports smoothing. Under the hood,
         this uses the  pcolormesh function in matplotlib.
 
-        :param xs: list of x values
+        :param xs: list of x values, or an (N, 2) array of x, y points if `ys`
+                   is not passed.
         :type xs: list, ndarray
-        :param ys: list of y values
-        :type ys: list, ndarray
+        :param ys: list of y values. Leave this out to pass all the points in
+                   `xs` as an (N, 2) array.
+        :type ys: list, ndarray, None
         :param bin_size: Bin size to use for the underlying 2D histogram. This
                          can either be a scalar, in which case the bin size will
                          be the same in both the x dimensions, or else a two
@@ -2434,6 +2869,7 @@ class Axes_bpl(Axes):
             bpl.equal_scale()
 
         """
+        xs, ys = tools._data_arrays(*tools._unpack_points(xs, ys))
         padding = tools._padding_from_smoothing(smoothing)
         # first get the underlying density histogram
         hist, x_edges, y_edges = tools.smart_hist_2d(
@@ -2712,6 +3148,9 @@ class Axes_bpl(Axes):
 
         # apply normalization
         if norm:
+            # scipy.integrate is slow to import, so only load it when needed
+            from scipy import integrate
+
             integral = integrate.trapz(x=points, y=result)
             result = result / integral
 
@@ -1,4 +1,28 @@
-import matplotlib.pyplot as plt
+import contextlib
+
+__all__ = ["subplots", "get_axis", "batch_apply", "live_plot"]
+
+_plt = None
+
+
+def _ensure_mpl_setup():
+    """
+    Import pyplot the first time it's actually needed.
+
+    Importing pyplot picks a backend and sets up the figure manager, which
+    scripts that only use the colors or tools never need. The projection itself
+    is still registered at import time in ``__init__.py``, since
+    ``fig.add_subplot(projection="bpl")`` has to work right after
+    ``import betterplotlib``.
+
+    :return: The ``matplotlib.pyplot`` module.
+    """
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot
+
+        _plt = matplotlib.pyplot
+    return _plt
 
 
 def subplots(*args, **kwargs):
@@ -12,13 +36,17 @@ def subplots(*args, **kwargs):
     """
 
     # use a bpl axes object. This is a stored projection in matplotlib
-    # that we can access
-    subplot_kwargs = kwargs.setdefault("subplot_kw", dict())
+    # that we can access. Only make a new dictionary if the user didn't pass one
+    # (or passed None, which plt.subplots also accepts)
+    subplot_kwargs = kwargs.get("subplot_kw")
+    if subplot_kwargs is None:
+        subplot_kwargs = kwargs["subplot_kw"] = {}
     subplot_kwargs.setdefault("projection", "bpl")
     # apply tight_layout if not using gridspec - can't do both
     if "gridspec_kw" not in kwargs:
         kwargs.setdefault("tight_layout", True)
 
+    plt = _ensure_mpl_setup()
     return plt.subplots(*args, **kwargs)
 
 
@@ -26,19 +54,169 @@ def get_axis():
     """
     Get a currently active betterplotlib axis object
     """
-    if plt.get_fignums() == []:
+    plt = _ensure_mpl_setup()
+    if not plt.get_fignums():
         fig, ax = subplots()
+        fig._bpl_axis = ax
         return ax
     fig = plt.gcf()
-    if len(fig.axes) != 0:
+    # The bpl axis we found last time is cached on the figure. It's still the
+    # right one as long as it's still on the figure, since new axes are only
+    # added after it. This keeps repeated calls like bpl.scatter(),
+    # bpl.add_labels(), etc. from searching through all the axes every time.
+    fig_axes = fig.axes
+    cached_ax = getattr(fig, "_bpl_axis", None)
+    if cached_ax is not None and cached_ax in fig_axes:
+        return cached_ax
+    if len(fig_axes) != 0:
         # go through and find a bpl axis
-        for ax in fig.axes:
+        for ax in fig_axes:
             if ax.name == "bpl":
+                fig._bpl_axis = ax
                 return ax
     # if we got here, there is no bpl axis available on this figure
     # if there is already an axis on this, raise an error
-    if len(fig.axes) > 0:
+    if len(fig_axes) > 0:
         raise ValueError("no axis available")
     # no axis availabe, so add one
     ax = fig.add_subplot(projection="bpl")
+    fig._bpl_axis = ax
     return ax
+
+
+def batch_apply(axes, method_name, *args, **kwargs):
+    """
+    Call the same axes method with the same arguments on several axes.
+
+    This is a shortcut for a loop like
+    ``for ax in [ax1, ax2]: ax.add_labels("X", "Y")``, which is common when
+    making many panels that should all look the same.
+
+    .. code-block:: python
+
+        fig, axs = bpl.subplots(nrows=2, ncols=3)
+        bpl.batch_apply(axs, "add_labels", "X Label", "Y Label")
+
+    :param axes: The axes to apply the method to. This can be any iterable of
+                 axes, including the 2D array of axes returned by `subplots`.
+    :param method_name: Name of the axes method to call, like "scatter" or
+                        "set_limits".
+    :type method_name: str
+    :param args: Positional arguments passed on to each method call.
+    :param kwargs: Keyword arguments passed on to each method call.
+    :return: List holding the return value from each axes, in order. For a 2D
+             array of axes, this follows the order of ``axes.flat``.
+    """
+    # arrays of axes (as returned by subplots with multiple rows and columns)
+    # need to be flattened before iterating over them
+    axes = getattr(axes, "flat", axes)
+    return [getattr(ax, method_name)(*args, **kwargs) for ax in axes]
+
+
+class _LivePlot(object):
+    """
+    Redraws a few changing artists on top of a saved background.
+
+    This is what `live_plot` hands back. See that function for how to use it.
+    """
+
+    def __init__(self, ax, artists):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.artists = []
+        self._background = None
+        for artist in artists:
+            self.add_artist(artist)
+        # the background needs to be saved again whenever the whole figure is
+        # redrawn, like when the window is resized
+        self._draw_id = self.canvas.mpl_connect("draw_event", self._on_draw)
+        self.canvas.draw()
+
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        for artist in self.artists:
+            self.ax.draw_artist(artist)
+
+    def add_artist(self, artist):
+        """
+        Add an artist to the ones redrawn on each update.
+
+        :param artist: The artist that will change between frames.
+        :return: The same artist, so this can wrap the call that makes it.
+        """
+        # animated artists are left out of regular draws, so they aren't saved
+        # into the background
+        artist.set_animated(True)
+        self.artists.append(artist)
+        # the saved background may include this artist, so it needs redoing
+        self._background = None
+        return artist
+
+    def update(self):
+        """
+        Redraw the changing artists on top of the saved background.
+
+        :return: None
+        """
+        if self._background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_artists()
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
+
+    def close(self):
+        """
+        Stop blitting, and go back to drawing the artists normally.
+
+        :return: None
+        """
+        self.canvas.mpl_disconnect(self._draw_id)
+        for artist in self.artists:
+            artist.set_animated(False)
+        self.canvas.draw_idle()
+
+
+@contextlib.contextmanager
+def live_plot(ax=None, artists=()):
+    """
+    Quickly redraw the parts of a plot that change in an animation loop.
+
+    Redrawing the whole figure for every frame is slow, since everything
+    (axes, ticks, labels, etc.) gets drawn again. Inside this context manager
+    the static parts of the plot are drawn once and saved, and each call to
+    `update` only draws the artists that change on top of that saved
+    background (this is called blitting).
+
+    .. code-block:: python
+
+        fig, ax = bpl.subplots()
+        ax.set_limits(0, 1, 0, 1)
+        with bpl.live_plot(ax) as live:
+            (line,) = ax.plot([], [])
+            live.add_artist(line)
+            for xs, ys in frames:
+                line.set_data(xs, ys)
+                live.update()
+
+    Artists are only redrawn within the axes, and the axes limits need to be
+    set beforehand, since they are part of the saved background.
+
+    :param ax: Axes holding the changing artists. If not passed, the current
+               betterplotlib axes is used.
+    :param artists: Artists that will change between frames. More can be added
+                    later with the `add_artist` method of the returned object.
+    :type artists: list
+    :return: Object whose `update` method redraws the changing artists.
+    """
+    if ax is None:
+        ax = get_axis()
+    live = _LivePlot(ax, artists)
+    try:
+        yield live
+    finally:
+        live.close()
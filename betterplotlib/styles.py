@@ -8,6 +8,65 @@ from cycler import cycler
 
 from . import colors
 
+# Style options used by all styles. These are applied with a single
+# rcParams.update() call in _common_style()
+_COMMON_RCPARAMS = {
+    "legend.scatterpoints": 1,
+    "legend.numpoints": 1,
+    # ^ these two needed for matplotlib 1.x
+    "savefig.format": "pdf",
+    "savefig.transparent": False,
+    "savefig.dpi": 300,
+    "savefig.facecolor": "w",
+    "axes.formatter.useoffset": False,
+    "figure.dpi": 100,
+    "figure.figsize": [10, 7],
+    "xtick.major.size": 5.0,
+    "xtick.minor.size": 2.5,
+    "ytick.major.size": 5.0,
+    "ytick.minor.size": 2.5,
+    "axes.titlesize": 22,
+    "font.size": 20,
+    "axes.labelsize": 20,
+    "xtick.labelsize": 16,
+    "ytick.labelsize": 16,
+    "legend.fontsize": 18,
+    "patch.edgecolor": colors.almost_black,
+    "text.color": colors.almost_black,
+    "axes.edgecolor": colors.almost_black,
+    "axes.labelcolor": colors.almost_black,
+    "xtick.color": colors.almost_black,
+    "ytick.color": colors.almost_black,
+    "grid.color": colors.almost_black,
+    # I like my own color cycle
+    "axes.prop_cycle": cycler("color", colors.color_cycle),
+    # change the colormap while I'm at it.
+    "image.cmap": "viridis",
+}
+
+# The "white" style overrides some of the colors
+_WHITE_RCPARAMS = {
+    "savefig.transparent": True,
+    "patch.edgecolor": "w",
+    "text.color": "w",
+    "axes.edgecolor": "w",
+    "axes.labelcolor": "w",
+    "xtick.color": "w",
+    "ytick.color": "w",
+    "grid.color": "w",
+    # I like my own color cycle based on one of the Tableu sets, but with
+    # added colors in front that look better on dark backgrounds
+    "axes.prop_cycle": cycler("color", ["w", "y"] + colors.color_cycle),
+}
+
+# The "latex" style changes everything to LaTeX
+_LATEX_RCPARAMS = {
+    "font.family": "serif",
+    "font.sans-serif": "Computer Modern Roman",
+    "font.serif": "Computer Modern Roman",
+    "text.usetex": True,
+}
+
 
 def set_style(style="default", font="Lato", fontweight="semibold"):
     """
@@ -85,25 +144,10 @@ def set_style(style="default", font="Lato", fontweight="semibold"):
         _set_font_settings(font, fontweight)
     elif style == "white":
         _set_font_settings(font, fontweight)
-        # override some of the colors
-        rcParams["savefig.transparent"] = True
-        rcParams["patch.edgecolor"] = "w"
-        rcParams["text.color"] = "w"
-        rcParams["axes.edgecolor"] = "w"
-        rcParams["axes.labelcolor"] = "w"
-        rcParams["xtick.color"] = "w"
-        rcParams["ytick.color"] = "w"
-        rcParams["grid.color"] = "w"
-        # I like my own color cycle based on one of the Tableu sets, but with
-        # added colors in front that look better on dark backgrounds
-        rcParams["axes.prop_cycle"] = cycler("color", ["w", "y"] + colors.color_cycle)
+        rcParams.update(_WHITE_RCPARAMS)
     elif style == "latex":
         # here font is ignored
-        # change everything to LaTeX
-        rcParams["font.family"] = "serif"
-        rcParams["font.sans-serif"] = "Computer Modern Roman"
-        rcParams["font.serif"] = "Computer Modern Roman"
-        rcParams["text.usetex"] = True
+        rcParams.update(_LATEX_RCPARAMS)
     else:
         raise ValueError("style not recognized")
 
@@ -112,41 +156,7 @@ def _common_style():
     """
     Set some of the style options used by all styles.
     """
-    rcParams["legend.scatterpoints"] = 1
-    rcParams["legend.numpoints"] = 1
-    # ^ these two needed for matplotlib 1.x
-    rcParams["savefig.format"] = "pdf"
-    rcParams["savefig.transparent"] = False
-    rcParams["savefig.dpi"] = 300
-    rcParams["savefig.facecolor"] = "w"
-    rcParams["axes.formatter.useoffset"] = False
-    rcParams["figure.dpi"] = 100
-    rcParams["figure.figsize"] = [10, 7]
-
-    rcParams["xtick.major.size"] = 5.0
-    rcParams["xtick.minor.size"] = 2.5
-    rcParams["ytick.major.size"] = 5.0
-    rcParams["ytick.minor.size"] = 2.5
-
-    rcParams["axes.titlesize"] = 22
-    rcParams["font.size"] = 20
-    rcParams["axes.labelsize"] = 20
-    rcParams["xtick.labelsize"] = 16
-    rcParams["ytick.labelsize"] = 16
-    rcParams["legend.fontsize"] = 18
-
-    rcParams["patch.edgecolor"] = colors.almost_black
-    rcParams["text.color"] = colors.almost_black
-    rcParams["axes.edgecolor"] = colors.almost_black
-    rcParams["axes.labelcolor"] = colors.almost_black
-    rcParams["xtick.color"] = colors.almost_black
-    rcParams["ytick.color"] = colors.almost_black
-    rcParams["grid.color"] = colors.almost_black
-
-    # I like my own color cycle
-    rcParams["axes.prop_cycle"] = cycler("color", colors.color_cycle)
-    # change the colormap while I'm at it.
-    rcParams["image.cmap"] = "viridis"
+    rcParams.update(_COMMON_RCPARAMS)
 
 
 def _set_font_settings(font, fontweight):
@@ -165,18 +175,20 @@ def _set_font_settings(font, fontweight):
     # font is. And for our purposes it doesn't matter, since it works fine if
     # we tell matplotlib it's a sans-serif font, even if it's not.
 
-    rcParams["font.family"] = "sans-serif"
-    rcParams["font.sans-serif"] = font
-    rcParams["text.usetex"] = False
-
-    # change math font too
-    rcParams["mathtext.fontset"] = "custom"
-    rcParams["mathtext.default"] = "regular"
-
-    # set the rest of the default parameters
-    rcParams["font.weight"] = fontweight
-    rcParams["axes.labelweight"] = fontweight
-    rcParams["axes.titleweight"] = fontweight
+    rcParams.update(
+        {
+            "font.family": "sans-serif",
+            "font.sans-serif": font,
+            "text.usetex": False,
+            # change math font too
+            "mathtext.fontset": "custom",
+            "mathtext.default": "regular",
+            # set the rest of the default parameters
+            "font.weight": fontweight,
+            "axes.labelweight": fontweight,
+            "axes.titleweight": fontweight,
+        }
+    )
 
     # The user might request a font that's not downloaded. To check this, we'll
     # see if the found font is the default. If so, we'll download the font
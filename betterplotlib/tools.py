@@ -1,7 +1,5 @@
-import matplotlib.pyplot as plt
+import functools
 import numpy as np
-from scipy import stats
-from scipy import ndimage
 import warnings
 import numbers
 
@@ -63,7 +61,29 @@ def _freedman_diaconis(data):
     :returns: the proper bin size
     :rtype: float
     """
-    return _freedman_diaconis_core(stats.iqr(data), len(data))
+    if len(data) == 0:
+        # _freedman_diaconis_core will raise the appropriate error for this
+        iqr = 0.0
+    else:
+        # numpy's vectorized sort is a few times faster than the selection
+        # np.percentile does, so sort once and interpolate the quartiles the
+        # same way np.percentile does.
+        sorted_data = np.sort(data)
+        positions = np.array([0.25, 0.75]) * (len(data) - 1)
+        lower = np.floor(positions).astype(int)
+        upper = np.minimum(lower + 1, len(data) - 1)
+        low_values = sorted_data[lower]
+        high_values = sorted_data[upper]
+        diffs = high_values - low_values
+        fractions = positions - lower
+        # np.percentile interpolates from the closer end, for better precision
+        q_25, q_75 = np.where(
+            fractions >= 0.5,
+            high_values - diffs * (1 - fractions),
+            low_values + diffs * fractions,
+        )
+        iqr = q_75 - q_25
+    return _freedman_diaconis_core(iqr, len(data))
 
 
 def _freedman_diaconis_core(iqr, n):
@@ -275,7 +295,7 @@ def make_bins(data, bin_size=None, padding=0):
     bin_size = type_checking.numeric_scalar(bin_size, msg.format("bin_size", "scalar"))
     padding = type_checking.numeric_scalar(padding, msg.format("padding", "scalar"))
 
-    return _binning(min(data), max(data), bin_size, padding)
+    return _binning(np.min(data), np.max(data), bin_size, padding)
 
 
 def _two_item_list(item):
@@ -302,6 +322,62 @@ def _two_item_list(item):
         return [item, item]
 
 
+def _unpack_points(xs, ys):
+    """
+    Split an (N, 2) array of points into x and y values, if needed.
+
+    Functions that take separate x and y data also accept all the points packed
+    into one (N, 2) array, passed as xs with ys left as None.
+
+    :param xs: Either the x values, or an (N, 2) array of points.
+    :param ys: The y values, or None if `xs` holds the points.
+    :return: The x and y values. When unpacking, these are views into the
+             original array, so no data is copied.
+    """
+    if ys is not None:
+        return xs, ys
+    points = np.asarray(xs)
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError("If ys is not passed, xs must be an (N, 2) array of points.")
+    return points[:, 0], points[:, 1]
+
+
+def _data_arrays(xs, ys):
+    """
+    Convert x and y data passed as lists into float arrays.
+
+    Lists would otherwise be converted again by every step that uses them.
+    Arrays are returned as they are, so that they aren't copied.
+
+    :param xs: The x values.
+    :param ys: The y values.
+    :return: The x and y values as arrays.
+    :raises: TypeError if the data isn't numerical.
+    """
+    msg = "{} must be a numerical array."
+    if not isinstance(xs, np.ndarray):
+        xs = type_checking.numeric_list_1d(xs, msg.format("x"))
+    if not isinstance(ys, np.ndarray):
+        ys = type_checking.numeric_list_1d(ys, msg.format("y"))
+    return xs, ys
+
+
+def _all_same(values):
+    """
+    Check whether every item in a list is the same value.
+
+    This compares everything to the first item in one vectorized pass, which is
+    much faster on large arrays than building a set of all the values.
+
+    :param values: List of values to check.
+    :type values: list, ndarray
+    :return: Whether all the values are identical. False for an empty list.
+    :rtype: bool
+    """
+    values = np.asarray(values)
+    return values.size > 0 and bool(np.all(values == values.flat[0]))
+
+
 def _smart_hist_2d_error_checking(xs, ys, log, bin_size, padding, weights, smoothing):
     """
     Does the error checking for the _smart_hist_2d function.
@@ -318,7 +394,7 @@ def _smart_hist_2d_error_checking(xs, ys, log, bin_size, padding, weights, smoot
         weights = type_checking.numeric_list_1d(weights, msg.format("Weights"))
         if len(weights) != len(xs):
             raise ValueError("Weights and data need to have the same length.")
-        if not all(weights >= 0):
+        if not np.all(weights >= 0):
             raise ValueError("Weights must be non-negative.")
 
     # parse the bin size options, then error check them.
@@ -373,6 +449,183 @@ def _smart_hist_2d_error_checking(xs, ys, log, bin_size, padding, weights, smoot
     )
 
 
+def _uniform_bin_indices(values, edges):
+    """
+    Find which bin each value falls in, for evenly spaced bin edges.
+
+    This follows the same rules as `np.histogram`: each bin includes its lower
+    edge but not its upper one, except for the last bin, which includes both.
+    The bin is found with arithmetic rather than a search through the edges,
+    then nudged by one if floating point error put it in the wrong bin.
+
+    :param values: Array of values to bin.
+    :type values: ndarray
+    :param edges: Evenly spaced bin edges.
+    :type edges: ndarray
+    :return: Bin index of each value, and a mask of which values are inside the
+             range of the edges at all.
+    :rtype: tuple of ndarray
+    """
+    n_bins = len(edges) - 1
+    scale = n_bins / (edges[-1] - edges[0])
+    idx = np.floor((values - edges[0]) * scale).astype(np.intp)
+    np.clip(idx, 0, n_bins - 1, out=idx)
+    idx -= values < edges[idx]
+    idx += (values >= edges[idx + 1]) & (idx < n_bins - 1)
+    in_range = (values >= edges[0]) & (values <= edges[-1])
+    return idx, in_range
+
+
+def _histogram_2d(xs, ys, x_edges, y_edges, weights=None):
+    """
+    Make a 2D histogram, giving the same result as `np.histogram2d`.
+
+    The bins made by `_binning` are always evenly spaced, in which case the bin
+    of each point can be calculated directly, then counted with `np.bincount`.
+    This is much faster than `np.histogram2d`, which does a binary search
+    through the edges for every point. Other edges fall back to
+    `np.histogram2d`.
+
+    :param xs: x values of the data.
+    :type xs: ndarray
+    :param ys: y values of the data.
+    :type ys: ndarray
+    :param x_edges: Bin edges along x.
+    :type x_edges: ndarray
+    :param y_edges: Bin edges along y.
+    :type y_edges: ndarray
+    :param weights: Weight of each point. If None, all have a weight of one.
+    :type weights: ndarray
+    :return: The histogram, with x along the first axis, then the x and y edges.
+    :rtype: tuple of ndarray
+    """
+    x_edges = np.asarray(x_edges, dtype=float)
+    y_edges = np.asarray(y_edges, dtype=float)
+    for edges in [x_edges, y_edges]:
+        widths = np.diff(edges)
+        if len(edges) < 2 or not np.allclose(widths, widths[0], rtol=1e-6, atol=0):
+            return np.histogram2d(xs, ys, [x_edges, y_edges], weights=weights)
+
+    x_idx, x_in = _uniform_bin_indices(np.asarray(xs, dtype=float), x_edges)
+    y_idx, y_in = _uniform_bin_indices(np.asarray(ys, dtype=float), y_edges)
+    in_range = x_in & y_in
+    n_y = len(y_edges) - 1
+    n_bins = (len(x_edges) - 1) * n_y
+    flat_idx = x_idx[in_range] * n_y + y_idx[in_range]
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)[in_range]
+    hist = np.bincount(flat_idx, weights=weights, minlength=n_bins)
+    hist = hist.astype(float, copy=False).reshape(-1, n_y)
+    return hist, x_edges, y_edges
+
+
+@functools.lru_cache(maxsize=32)
+def _gaussian_kernel1d(sigma):
+    """
+    Make a normalized 1D Gaussian kernel, the same one `ndimage` uses.
+
+    The kernel is cut off at 4 sigma. Kernels are cached, since the same
+    smoothing is often used for many plots. The returned array is read only, so
+    the cached copy can't be changed by accident.
+
+    :param sigma: Standard deviation of the Gaussian, in units of array cells.
+    :type sigma: float
+    :return: Kernel, with length 2 * radius + 1.
+    :rtype: np.ndarray
+    """
+    radius = int(4.0 * sigma + 0.5)
+    x = np.arange(-radius, radius + 1)
+    # written the same way as in ndimage, so the results are identical
+    kernel = np.exp(-0.5 / (sigma * sigma) * x**2)
+    kernel /= kernel.sum()
+    kernel.flags.writeable = False
+    return kernel
+
+
+def _fft_gaussian_filter1d(hist, sigma, axis):
+    """
+    Smooth an array with a Gaussian along one axis, using an FFT convolution.
+
+    This gives the same result as `ndimage.gaussian_filter1d` with its default
+    settings (a kernel cut off at 4 sigma, and reflecting at the boundaries),
+    up to floating point error. The direct convolution scales with the kernel
+    width, so this is faster for wide kernels.
+
+    :param hist: Array to smooth.
+    :type hist: np.ndarray
+    :param sigma: Standard deviation of the Gaussian, in units of array cells.
+    :type sigma: float
+    :param axis: Axis to smooth along.
+    :type axis: int
+    :return: Smoothed array, with the same shape as `hist`.
+    :rtype: np.ndarray
+    """
+    from scipy import fft
+
+    kernel = _gaussian_kernel1d(sigma)
+    radius = len(kernel) // 2
+
+    # ndimage's "reflect" boundary is the same as numpy's "symmetric" padding
+    pad_width = [(0, 0)] * hist.ndim
+    pad_width[axis] = (radius, radius)
+    padded = np.pad(hist, pad_width, mode="symmetric")
+
+    n_fft = fft.next_fast_len(padded.shape[axis] + 2 * radius, real=True)
+    kernel_shape = [1] * hist.ndim
+    kernel_shape[axis] = -1
+    kernel_fft = fft.rfft(kernel, n_fft).reshape(kernel_shape)
+    full = fft.irfft(fft.rfft(padded, n_fft, axis=axis) * kernel_fft, n_fft, axis=axis)
+
+    # Each cell of the original array is at the center of the kernel 2 * radius
+    # cells into the full convolution.
+    keep = [slice(None)] * hist.ndim
+    keep[axis] = slice(2 * radius, 2 * radius + hist.shape[axis])
+    smooth = full[tuple(keep)]
+
+    # The FFT leaves roundoff noise (both positive and negative) in cells that
+    # should be empty. The noise is about the machine precision times the
+    # largest value along each line, growing with the length of the transform.
+    # Set anything below that back to zero, so it can't be mistaken for data in
+    # the levels and color scaling. Lines with only small values keep them.
+    line_max = np.max(np.abs(hist), axis=axis, keepdims=True)
+    noise = n_fft * np.finfo(smooth.dtype).eps * line_max
+    smooth[np.abs(smooth) <= noise] = 0
+    return smooth
+
+
+def _gaussian_smooth(hist, sigmas):
+    """
+    Smooth a 2D histogram with a Gaussian kernel.
+
+    This gives the same result as `ndimage.gaussian_filter`. Axes with wide
+    kernels are smoothed with an FFT convolution instead of a direct one, as
+    that is faster once the kernel is more than about 10 cells wide.
+
+    :param hist: 2D histogram to smooth.
+    :type hist: np.ndarray
+    :param sigmas: Standard deviation of the Gaussian along each axis, in units
+                   of histogram cells.
+    :type sigmas: list
+    :return: Smoothed histogram.
+    :rtype: np.ndarray
+    """
+    # scipy.ndimage is slow to import, and is only needed for density contours,
+    # so it isn't loaded until then
+    from scipy import ndimage
+
+    for axis, sigma in enumerate(sigmas):
+        # ndimage skips axes with no smoothing, so we do too
+        if sigma <= 1e-15:
+            continue
+        if sigma < 10:
+            # the same as ndimage.gaussian_filter1d, but with a cached kernel
+            kernel = _gaussian_kernel1d(sigma)
+            hist = ndimage.correlate1d(hist, kernel, axis=axis, mode="reflect")
+        else:
+            hist = _fft_gaussian_filter1d(hist, sigma, axis)
+    return hist
+
+
 def smart_hist_2d(
     xs, ys, bin_size=None, padding=0, weights=None, smoothing=0, log=False
 ):
@@ -436,11 +689,12 @@ def smart_hist_2d(
     weights = validated_params[8]
     smoothing_x, smoothing_y = validated_params[9:]
 
-    # if the user wants log, do that
+    # if the user wants log, do that. The error checking made new arrays for xs
+    # and ys, so we can take the log in place without touching the user's data.
     if log_x:
-        xs = np.log10(xs)
+        np.log10(xs, out=xs)
     if log_y:
-        ys = np.log10(ys)
+        np.log10(ys, out=ys)
 
     # then we can go ahead and make the bin edges using this data
     bin_edges = [
@@ -453,13 +707,13 @@ def smart_hist_2d(
     bin_size_y = bin_edges[1][1] - bin_edges[1][0]
 
     # We can then use the bins to create the histogram
-    hist, x_edges, y_edges = np.histogram2d(xs, ys, bin_edges, weights=weights)
+    hist, x_edges, y_edges = _histogram_2d(xs, ys, *bin_edges, weights=weights)
 
     # if the user wants to smooth, do that.
     if smoothing_x > 0 or smoothing_y > 0:
         kernel_x = smoothing_x / bin_size_x
         kernel_y = smoothing_y / bin_size_y
-        hist = ndimage.gaussian_filter(hist, [kernel_x, kernel_y])
+        hist = _gaussian_smooth(hist, [kernel_x, kernel_y])
 
     # we need to transpose the histogram to get it to line up with the x, y
     # used in other plotting functions.
@@ -474,7 +728,7 @@ def smart_hist_2d(
     return hist, x_edges, y_edges
 
 
-def _unique_total_sorted(values):
+def _unique_total_sorted(values, return_unique=False):
     """
     Returns a list of the unique values in a list, weighted by the number of
     times they appear in the original list. This is basically the "mass" held
@@ -494,15 +748,23 @@ def _unique_total_sorted(values):
     :param values: List of values to sort and find uniques of. Scalars and
                    empty lists are allowed, but only lists that contain
                    numerical data otherwise.
+    :param return_unique: Whether to also return the sorted unique values
+                          themselves. This saves sorting the values again if
+                          they are needed too.
+    :type return_unique: bool
     :return: Sorted list of unique values in the list, weighted by the number
-             of time that it appears in the array.
+             of time that it appears in the array. If `return_unique` is True,
+             the sorted unique values are returned first.
     :rtype: np.ndarray
     """
     unique_values, appearances = np.unique(values, return_counts=True)
     try:
-        return unique_values * appearances
+        totals = unique_values * appearances
     except TypeError:
         raise TypeError("Need an array in `unique_total_sorted`.")
+    if return_unique:
+        return unique_values, totals
+    return totals
 
 
 def _percentile_level_warning_uncertain(percent):
@@ -585,7 +847,7 @@ def percentile_level(densities, percentages):
         raise ValueError("Empty density array not allowed")
 
     total_mass = np.sum(densities)
-    if any(densities < 0):
+    if np.any(densities < 0):
         raise ValueError("Density must be non-negative.")
     # turn percentages into a list
     try:
@@ -602,9 +864,11 @@ def percentile_level(densities, percentages):
 
     # the accumulated mass is the cumulative sum (starting from the highest
     # density point). We will get the array of values at each point first.
-    densities_high_to_low = np.unique(densities)[::-1]
-    densities_to_accumulate = _unique_total_sorted(densities)[::-1]
-    accumulated_mass = np.cumsum(densities_to_accumulate)
+    unique_densities, densities_to_accumulate = _unique_total_sorted(
+        densities, return_unique=True
+    )
+    densities_high_to_low = unique_densities[::-1]
+    accumulated_mass = np.cumsum(densities_to_accumulate[::-1])
     # then get the fraction of the mass that represents
     mass_fractions = accumulated_mass / total_mass
 
@@ -618,10 +882,12 @@ def percentile_level(densities, percentages):
             return_values[percent] = 0.98 * densities_high_to_low[-1]
             continue
         # find the index where we are closest to the desired percentage while
-        # getting at least to the desired value.
-        best_idx = np.argmax((mass_fractions - percent) >= 0)
-        # this works because argmax will find the first value that has the
-        # condition being true, which will be the first one over the threshold.
+        # getting at least to the desired value. The mass fractions only ever
+        # increase, so this is the first value at or over the threshold.
+        best_idx = np.searchsorted(mass_fractions, percent, side="left")
+        # Roundoff in the sum can leave the total just short of a percentage
+        # very close to one. Then the level is the one enclosing everything.
+        best_idx = min(best_idx, len(mass_fractions) - 1)
 
         # see if we need to raise a warning for uncertain levels.
         best_mass_frac = mass_fractions[best_idx]
@@ -738,3 +1004,73 @@ def gaussian(x, mean, standard_deviation):
     norm = 1.0 / (s * np.sqrt(2 * np.pi))
     exponent = -0.5 * ((x - mean) / s) ** 2
     return norm * np.exp(exponent)
+
+
+def _invert_monotonic(func, values, low, high, log=False, n_samples=4096):
+    """
+    Find where a monotonic function takes each of the given values.
+
+    The function is sampled on a grid between `low` and `high` to bracket each
+    value, then all the brackets are bisected at once. This only needs the
+    function to be evaluated on arrays a few dozen times, no matter how many
+    values there are.
+
+    :param func: Function to invert. Must accept and return numpy arrays.
+    :param values: Outputs of `func` to find the inputs for.
+    :type values: list, np.ndarray
+    :param low: One end of the range of inputs to search.
+    :type low: float
+    :param high: The other end of the range of inputs to search.
+    :type high: float
+    :param log: Whether to space the sampling grid logarithmically, which is
+                better for functions of a log-scaled axis. Both `low` and
+                `high` must be positive to do this.
+    :type log: bool
+    :param n_samples: Number of points in the sampling grid.
+    :type n_samples: int
+    :return: The input to `func` that gives each value, or NaN for values that
+             `func` doesn't reach between `low` and `high`. If `func` can't be
+             evaluated on an array or isn't strictly monotonic over the range,
+             None is returned instead.
+    :rtype: np.ndarray
+    """
+    if log:
+        grid = np.geomspace(low, high, n_samples)
+    else:
+        grid = np.linspace(low, high, n_samples)
+    try:
+        with np.errstate(all="ignore"):
+            samples = np.asarray(func(grid), dtype=float)
+    except (TypeError, ValueError):
+        # Functions that only work on scalars fail this way, either converting
+        # the array to a number or checking it in an if statement. Other errors
+        # are real bugs, so let them through.
+        return None
+    if samples.shape != grid.shape or not np.all(np.isfinite(samples)):
+        return None
+
+    # searchsorted needs the samples to be increasing
+    steps = np.diff(samples)
+    if np.all(steps < 0):
+        grid = grid[::-1]
+        samples = samples[::-1]
+    elif not np.all(steps > 0):
+        return None
+
+    # bracket each value between two grid points. Keeping the bracket in the
+    # order of the samples means `lower` always gives a value below the target.
+    values = np.asarray(values, dtype=float)
+    idx = np.clip(np.searchsorted(samples, values), 1, n_samples - 1)
+    lower = grid[idx - 1]
+    upper = grid[idx]
+    # each step halves the bracket, so this is enough to get to floating point
+    # precision from the grid spacing
+    for _ in range(60):
+        middle = 0.5 * (lower + upper)
+        with np.errstate(all="ignore"):
+            below = func(middle) < values
+        lower = np.where(below, middle, lower)
+        upper = np.where(below, upper, middle)
+    result = 0.5 * (lower + upper)
+    result[(values < samples[0]) | (values > samples[-1])] = np.nan
+    return result
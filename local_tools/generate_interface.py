@@ -1,18 +1,16 @@
 # auto generates _interface.py
-import subprocess
+import ast
+import os
+import textwrap
 from pathlib import Path
 
-from betterplotlib.axes_bpl import Axes_bpl
-
 # get the locations of the files
 code_dir = Path(__file__).parent.parent / "betterplotlib"
 interface_loc = code_dir / "_interface.py"
 axes_loc = code_dir / "axes_bpl.py"
-# open the new file for writing.
-interface = open(interface_loc, "w")
 
-# write a header
-interface.write(
+# the header of the file
+header = (
     "# =============================== IMPORANT =====================================\n"
     "# This file is autogenerated with the local_tools/generate_interface.py script.\n"
     "# Do not edit this file! Instead edit axes_bpl.py, and run generate_interface.py\n"
@@ -21,95 +19,148 @@ interface.write(
     "\n"
     "from .manage_axes import get_axis\n"
     "\n"
+    "\n"
 )
 
 
-def get_functions(loc, definition):
-    func_args = []
-    with open(loc, "r") as original:
-        in_axes = False
-        in_def = False
-        this_def = ""
-        for line in original:
-            if in_axes is False and line.strip() == definition:
-                in_axes = True
-                continue
-            if in_axes and line.startswith("    def "):
-                in_def = True
-                this_def = ""
-            if in_def:
-                if "def" in line:
-                    # replace self, both with comma and without
-                    this_def = line.strip() + "\n"
-                else:
-                    this_def += line[4:]
-                    if not line.endswith("\n"):
-                        this_def += "\n"
-            if in_def and ":" in line:
-                in_def = False
-                # now that we're done, get rid of self
-                this_def = this_def.replace("self,", "").replace("self", "")
-                # I don't want to include any functions that start with an underscore
-                if not this_def.startswith("def _"):
-                    func_args.append(this_def)
-
-    return func_args
-
-
-def strip_defaults(function_def):
-    # gets rid of all the default parameters in a function argument so that it
-    # can be turned from the definition into a function call
-
-    # first get where the arguments start
-    first_paren_idx = function_def.find("(")
-    # get the function name and first parenthesis
-    def_begin = function_def[4 : first_paren_idx + 1]
-    # then get the arguments. The -3 at the end takes care of the newline,
-    # colon, and closing parenthesis.
-    args = function_def[first_paren_idx + 1 : -3]
-
-    # then we can examine each one in turn, formatiing it properly
-    args_list = []
-    for arg in args.split(","):
-        # find ehere the equals sign indicating a default parameter is
-        idx_equals = arg.find("=")
-        # if there isn't one, there is no default, so we can just keep the
-        # whole thing
-        if idx_equals == -1:
-            args_list.append(arg)
-        # if there is a default paraemeter, get rid of it.
-        else:
-            args_list.append(arg[0:idx_equals])
-
-    # then put them back into a comma separated list
-    args_joined = ",".join(args_list)
-    # to have things line up properly in the file, we need to add some spaces
-    args_joined = args_joined.replace("\n", "\n          ")
-    # then join everything together
-    return def_begin + args_joined + ")"
-
-
-axes_definition = "class Axes_bpl(Axes):"
-
-axes_functions_args = get_functions(axes_loc, axes_definition)
-
-for function_args in axes_functions_args:
-    func_name = function_args.split()[1].split("(")[0]
-    func_args_no_defauts = strip_defaults(function_args)
-    func_docstring = Axes_bpl.__dict__[func_name].__doc__
-    func_docstring = func_docstring.replace("        ", "    ")
-    interface.write(
-        function_args
-        + '    """'
-        + func_docstring
-        + '"""\n'
-        + "    ax = get_axis()\n"
-        + "    return ax.{}\n".format(func_args_no_defauts)
+def format_expression(node):
+    # ast.unparse only exists on Python 3.9+, so write out the expressions that
+    # can show up in a signature ourselves. Literals (including negative numbers
+    # and tuples of them) go through repr, and names like np.inf are rebuilt
+    # from their parts.
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return format_expression(node.value) + "." + node.attr
+    try:
+        value = ast.literal_eval(node)
+    except ValueError:
+        raise ValueError(
+            "can't write out the expression on line {} of axes_bpl.py, add it to "
+            "format_expression in generate_interface.py".format(node.lineno)
+        )
+    # black uses double quotes for strings, so match that for string defaults
+    if isinstance(value, str) and '"' not in value and "\\" not in value:
+        return '"{}"'.format(value)
+    return repr(value)
+
+
+def format_parameter(arg, default=None):
+    param = arg.arg
+    if arg.annotation is not None:
+        param += ": " + format_expression(arg.annotation)
+        if default is not None:
+            return param + " = " + format_expression(default)
+    if default is not None:
+        param += "=" + format_expression(default)
+    return param
+
+
+def scan_module(loc):
+    # parse the file once, and get the methods of every class in it
+    tree = ast.parse(Path(loc).read_text())
+    return {
+        node.name: [item for item in node.body if isinstance(item, ast.FunctionDef)]
+        for node in tree.body
+        if isinstance(node, ast.ClassDef)
+    }
+
+
+def get_functions(methods):
+    functions = []
+    for node in methods:
+        # I don't want to include any functions that start with an underscore
+        if node.name.startswith("_"):
+            continue
+        args = node.args
+        # defaults line up with the last positional arguments. The first of those
+        # arguments is self, which we get rid of. Positional-only arguments only
+        # exist in the AST on Python 3.8+.
+        positional = getattr(args, "posonlyargs", []) + args.args
+        defaults = [None] * (len(positional) - len(args.defaults)) + args.defaults
+        params = [format_parameter(a, d) for a, d in zip(positional, defaults)][1:]
+        if args.vararg is not None:
+            params.append("*" + format_parameter(args.vararg))
+        elif args.kwonlyargs:
+            params.append("*")
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+            params.append(format_parameter(arg, default))
+        if args.kwarg is not None:
+            params.append("**" + format_parameter(args.kwarg))
+
+        # The call passes everything through with no defaults. Keyword-only
+        # arguments have to be passed by name.
+        call_args = [arg.arg for arg in positional[1:]]
+        if args.vararg is not None:
+            call_args.append("*" + args.vararg.arg)
+        call_args += ["{0}={0}".format(arg.arg) for arg in args.kwonlyargs]
+        if args.kwarg is not None:
+            call_args.append("**" + args.kwarg.arg)
+
+        # get the docstring straight from the source, exactly as written
+        docstring = ast.get_docstring(node, clean=False)
+        functions.append((node.name, params, call_args, docstring))
+
+    return functions
+
+
+def format_arguments(opening, arguments, closing, indent=""):
+    # Lays out a function definition or call the same way black would. First try
+    # everything on one line, then all the arguments on their own line, then one
+    # argument per line with a trailing comma.
+    max_length = 88
+    joined = ", ".join(arguments)
+    one_line = indent + opening + joined + closing
+    if len(one_line) <= max_length:
+        return one_line + "\n"
+
+    inner_indent = indent + "    "
+    if len(inner_indent + joined) <= max_length:
+        inner = inner_indent + joined + "\n"
+    else:
+        inner = "".join(inner_indent + arg + ",\n" for arg in arguments)
+    return indent + opening + "\n" + inner + indent + closing + "\n"
+
+
+axes_functions_args = get_functions(scan_module(axes_loc)["Axes_bpl"])
+
+
+def format_docstring(docstring):
+    # The methods are indented one level deeper than the functions in the
+    # interface. Dedenting only touches the leading whitespace of each line, so
+    # indentation inside the docstring (like in code examples) is kept.
+    if docstring is None:
+        return ""
+    docstring = textwrap.indent(textwrap.dedent(docstring), "    ")
+    # dedent strips the whitespace before the closing quotes, so put it back
+    if docstring.endswith("\n"):
+        docstring += "    "
+    return '    """{}"""\n'.format(docstring)
+
+
+# what each function in the interface looks like
+function_template = "{definition}{docstring}    ax = get_axis()\n{call}"
+
+# build each function separately, then put blank lines between them all at once
+function_blocks = []
+for func_name, params, call_args, docstring in axes_functions_args:
+    func_docstring = format_docstring(docstring)
+    definition = format_arguments("def {}(".format(func_name), params, "):")
+    call = format_arguments("return ax.{}(".format(func_name), call_args, ")", "    ")
+    function_blocks.append(
+        function_template.format(
+            definition=definition, docstring=func_docstring, call=call
+        )
     )
-    if function_args != axes_functions_args[-1]:
-        interface.write("\n\n")
-
-interface.close()
-
-# then run black code style
-subprocess.run(["black", str(interface_loc)])
+text = header + "\n\n".join(function_blocks)
+
+# The whole file is written with a single write_text call, and only if the
+# generated text actually changed. What we generate is already formatted the way
+# black would do it, but developers can still run black over it by setting the
+# BPL_FORMAT environment variable.
+if not interface_loc.exists() or interface_loc.read_text() != text:
+    interface_loc.write_text(text)
+if os.environ.get("BPL_FORMAT"):
+    import subprocess
+
+    subprocess.run(["black", str(interface_loc)])
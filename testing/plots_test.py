@@ -1,6 +1,7 @@
 import imageio.v2 as imageio
 import numpy as np
 import matplotlib.pyplot as plt  # for some tests
+from matplotlib.colors import to_rgba
 from pathlib import Path
 import pytest
 from tools_test import clear_all_open_figures
@@ -343,13 +344,16 @@ functions = [
     ("axes_bpl", "legend"),
     ("axes_bpl", "equal_scale"),
     ("axes_bpl", "easy_add_text"),
+    ("axes_bpl", "easy_add_texts"),
     ("axes_bpl", "density_contour"),
     ("axes_bpl", "density_contourf"),
     ("axes_bpl", "contour_scatter"),
     ("axes_bpl", "data_ticks"),
     ("axes_bpl", "plot"),
     ("axes_bpl", "axvline"),
+    ("axes_bpl", "axvlines"),
     ("axes_bpl", "axhline"),
+    ("axes_bpl", "axhlines"),
     ("axes_bpl", "errorbar"),
     ("axes_bpl", "twin_axis_simple"),
     ("axes_bpl", "twin_axis"),
@@ -486,6 +490,30 @@ def test_scatter_facecolor():
     assert image_similarity_full(fig, "scatter_facecolor.png")
 
 
+def test_scatter_rasterize_large():
+    fig, ax = bpl.subplots()
+    points = ax.scatter(xs_normal_10000, ys_normal_10000)
+    assert points.get_rasterized()
+
+
+def test_scatter_rasterize_small():
+    fig, ax = bpl.subplots()
+    points = ax.scatter(xs_uniform_10, ys_uniform_10)
+    assert not points.get_rasterized()
+
+
+def test_scatter_rasterize_user_override():
+    fig, ax = bpl.subplots()
+    points = ax.scatter(xs_normal_10000, ys_normal_10000, rasterized=False)
+    assert not points.get_rasterized()
+
+
+def test_scatter_rasterize_threshold():
+    fig, ax = bpl.subplots()
+    points = ax.scatter(xs_uniform_10, ys_uniform_10, rasterize_threshold=5)
+    assert points.get_rasterized()
+
+
 # ------------------------------------------------------------------------------
 #
 # Testing hist
@@ -509,6 +537,15 @@ def test_hist_not_binsize_and_bins():
         ax.hist(xs_normal_500, bin_size=1, bins=np.arange(-10, 10, 0.5))
 
 
+def test_hist_bin_size_edges_list_and_array():
+    fig, ax = bpl.subplots()
+    data = [0.3, 1.7, 2.2, 4.9]
+    _, edges_list, _ = ax.hist(data, bin_size=1)
+    _, edges_array, _ = ax.hist(np.array(data), bin_size=1)
+    assert np.array_equal(edges_list, edges_array)
+    assert edges_list[0] <= min(data) and edges_list[-1] >= max(data)
+
+
 # ------------------------------------------------------------------------------
 #
 # Testing add labels
@@ -521,6 +558,19 @@ def test_hist_not_binsize_and_bins():
 # Testing set limits
 #
 # ------------------------------------------------------------------------------
+def test_set_limits_one_axis_leaves_other_alone():
+    fig, ax = bpl.subplots()
+    ax.set_limits(y_min=0, y_max=1)
+    assert ax.get_ylim() == (0, 1)
+    assert not ax.get_autoscaley_on()
+    assert ax.get_autoscalex_on()
+
+
+def test_set_limits_partial():
+    fig, ax = bpl.subplots()
+    ax.set_limits(x_min=2, x_max=None, y_max=3)
+    assert ax.get_xlim()[0] == 2
+    assert ax.get_ylim()[1] == 3
 
 
 # ------------------------------------------------------------------------------
@@ -601,6 +651,35 @@ def test_easy_add_text_validate_location():
         ax.easy_add_text("text", "upper left wrong")
     with pytest.raises(ValueError):
         ax.easy_add_text("text", 10)
+    with pytest.raises(ValueError):
+        ax.easy_add_text("text", [1])
+
+
+def test_easy_add_texts_matches_single():
+    fig, ax = bpl.subplots()
+    texts = ax.easy_add_texts([("a", 1), ("b", "upper right")], color="red")
+    assert [t.get_text() for t in texts] == ["a", "b"]
+    assert texts[0].get_position() == (0.04, 0.04)
+    assert texts[1].get_position() == (0.96, 0.96)
+    assert texts[1].get_ha() == "right"
+    assert all(t.get_color() == "red" for t in texts)
+
+
+def test_easy_add_texts_validate():
+    fig, ax = bpl.subplots()
+    with pytest.raises(ValueError):
+        ax.easy_add_texts([("a", 1), ("b", 10)])
+    with pytest.raises(ValueError):
+        ax.easy_add_texts([("a", 1)], ha="left")
+
+
+def test_easy_add_text_number_and_name_match():
+    fig, ax = bpl.subplots()
+    text_number = ax.easy_add_text("text", 8)
+    text_name = ax.easy_add_text("text", "upper center")
+    assert text_number.get_position() == text_name.get_position() == (0.5, 0.96)
+    assert text_number.get_ha() == text_name.get_ha() == "center"
+    assert text_number.get_va() == text_name.get_va() == "top"
 
 
 # ------------------------------------------------------------------------------
@@ -800,6 +879,20 @@ def test_density_contour_weights_image():
     assert image_similarity_full(fig, "density_contour_weights.png")
 
 
+def test_density_contour_packed_points():
+    fig, ax = bpl.subplots()
+    separate = ax.density_contour(
+        xs_normal_500, ys_normal_500, bin_size=0.1, smoothing=0.3
+    )
+    points = np.column_stack([xs_normal_500, ys_normal_500])
+    packed = ax.density_contour(points, bin_size=0.1, smoothing=0.3)
+    assert np.array_equal(separate.levels, packed.levels)
+    for sep_segs, pack_segs in zip(separate.allsegs, packed.allsegs):
+        assert len(sep_segs) == len(pack_segs)
+        for sep_line, pack_line in zip(sep_segs, pack_segs):
+            assert np.array_equal(sep_line, pack_line)
+
+
 # ------------------------------------------------------------------------------
 #
 # Testing density filled contour
@@ -884,11 +977,170 @@ def test_contour_scatter_scatter_outside_contours_image():
     assert image_similarity_full(fig, "contour_scatter_outside_contours.png")
 
 
+def test_contour_scatter_no_filled_labels():
+    fig, ax = bpl.subplots()
+    with pytest.raises(ValueError) as err_msg:
+        ax.contour_scatter(
+            xs_normal_10000, ys_normal_10000, contourf_kwargs={"labels": True}
+        )
+    assert str(err_msg.value) == "Filled contours cannot have labels."
+
+
+def test_contour_scatter_one_histogram(monkeypatch):
+    # the filled contours and contour lines should share a histogram
+    calls = []
+    smart_hist_2d = bpl.tools.smart_hist_2d
+
+    def counting_hist(*args, **kwargs):
+        calls.append(1)
+        return smart_hist_2d(*args, **kwargs)
+
+    monkeypatch.setattr(bpl.tools, "smart_hist_2d", counting_hist)
+    fig, ax = bpl.subplots()
+    ax.contour_scatter(xs_normal_10000, ys_normal_10000, bin_size=0.1, smoothing=0.2)
+    assert len(calls) == 1
+
+
+def test_contour_scatter_transparent_fill_skipped():
+    fig, ax = bpl.subplots()
+    ax.contour_scatter(
+        xs_normal_10000, ys_normal_10000, bin_size=0.1, contourf_kwargs={"alpha": 0}
+    )
+    # just the contour lines and the scatter points, no filled contours
+    assert len(ax.collections) == 2
+    assert not any(c.filled for c in ax.collections if hasattr(c, "filled"))
+
+
+@pytest.mark.parametrize("name", ["white", "background_grey", "modified_greys"])
+def test_contour_scatter_named_fill_cmap_not_shared(name):
+    # the named colormaps are cached, but each call should get its own copy
+    first = bpl.axes_bpl._fill_cmap(name)
+    second = bpl.axes_bpl._fill_cmap(name)
+    assert first is not second
+    first.set_under("red")
+    assert tuple(second.get_under()[:3]) != (1.0, 0.0, 0.0)
+
+
+def test_contour_scatter_grid_containment_matches_full_test():
+    # a ring has an inner and outer contour, so points are inside 0, 1, or 2
+    radii = np.random.normal(5, 0.5, 20000)
+    angles = np.random.uniform(0, 2 * np.pi, 20000)
+    points = np.column_stack([radii * np.cos(angles), radii * np.sin(angles)])
+    fig, ax = bpl.subplots()
+    x_cen, y_cen, hist = ax._density_hist(points, None, 0.1, 0.3, None, log=False)
+    contours = ax._draw_density_contours(
+        x_cen, y_cen, hist, None, labels=False, filled=False
+    )
+    lines = contours.allsegs[0]
+    full = bpl.axes_bpl._contours_containing(points, lines) % 2
+    grid = bpl.axes_bpl._contours_containing_on_grid(
+        points, lines, x_cen, y_cen, hist, contours.levels[0]
+    )
+    assert np.array_equal(full, grid)
+
+
+@pytest.mark.parametrize(
+    "grid", [np.arange(-2, 2, 0.1) + 0.05, np.array([-1, -0.5, 0.1, 0.2, 1.5])]
+)
+def test_contour_scatter_grid_cells_matches_search(grid):
+    # include values beyond the grid and exactly on the grid values
+    values = np.concatenate([np.random.uniform(-3, 3, 1000), grid])
+    expected = np.searchsorted(grid, values, side="right") - 1
+    expected = np.clip(expected, 0, len(grid) - 2)
+    assert np.array_equal(bpl.axes_bpl._grid_cells(values, grid), expected)
+
+
+def test_contour_scatter_max_points():
+    fig, ax = bpl.subplots()
+    ax.contour_scatter(
+        xs_normal_10000, ys_normal_10000, bin_size=0.1, scatter_max_points=50
+    )
+    first = ax.collections[-1].get_offsets()
+    assert len(first) == 50
+    # the subset should be the same every time
+    ax.contour_scatter(
+        xs_normal_10000, ys_normal_10000, bin_size=0.1, scatter_max_points=50
+    )
+    assert np.array_equal(first, ax.collections[-1].get_offsets())
+
+
+def test_contour_scatter_max_points_negative():
+    fig, ax = bpl.subplots()
+    with pytest.raises(ValueError) as err_msg:
+        ax.contour_scatter(xs_normal_10000, ys_normal_10000, scatter_max_points=-1)
+    assert str(err_msg.value) == "`scatter_max_points` must be non-negative."
+
+
+def test_contour_scatter_packed_points():
+    fig, ax = bpl.subplots()
+    separate = ax.contour_scatter(
+        xs_normal_500, ys_normal_500, bin_size=0.1, smoothing=0.3
+    )
+    separate_points = ax.collections[-1].get_offsets()
+    points = np.column_stack([xs_normal_500, ys_normal_500])
+    packed = ax.contour_scatter(points, bin_size=0.1, smoothing=0.3)
+    packed_points = ax.collections[-1].get_offsets()
+    assert np.array_equal(separate.levels, packed.levels)
+    for sep_segs, pack_segs in zip(separate.allsegs, packed.allsegs):
+        assert len(sep_segs) == len(pack_segs)
+        for sep_line, pack_line in zip(sep_segs, pack_segs):
+            assert np.array_equal(sep_line, pack_line)
+    # the same points should be scattered outside the contours
+    assert np.array_equal(separate_points, packed_points)
+
+
 # ------------------------------------------------------------------------------
 #
 # Testing data ticks
 #
 # ------------------------------------------------------------------------------
+def test_data_ticks_one_artist_per_axis():
+    fig, ax = bpl.subplots()
+    x_ticks, y_ticks = ax.data_ticks(xs_normal_500, ys_normal_500[:50])
+    assert len(ax.lines) == 0
+    assert len(x_ticks.get_segments()) == 500
+    assert len(y_ticks.get_segments()) == 50
+    # x ticks are at the data values, starting from the bottom of the axes
+    first_tick = x_ticks.get_segments()[0]
+    assert np.allclose(first_tick, [[xs_normal_500[0], 0], [xs_normal_500[0], 0.015]])
+
+
+def test_data_ticks_extent_and_kwargs():
+    fig, ax = bpl.subplots()
+    x_ticks, y_ticks = ax.data_ticks([1, 2], [1, 2], 0.02, color="red")
+    assert np.allclose(x_ticks.get_segments()[0], [[1, 0], [1, 0.02]])
+    assert np.allclose(x_ticks.get_color(), to_rgba("red"))
+    assert np.allclose(y_ticks.get_color(), to_rgba("red"))
+
+
+def test_data_ticks_limits_are_data_range_with_margins():
+    fig, ax = bpl.subplots()
+    ax.data_ticks(xs_normal_500, ys_normal_500)
+    x_margin, y_margin = ax.margins()
+    for data, limits, margin in [
+        (xs_normal_500, ax.get_xlim(), x_margin),
+        (ys_normal_500, ax.get_ylim(), y_margin),
+    ]:
+        span = np.ptp(data)
+        expected = (data.min() - margin * span, data.max() + margin * span)
+        assert np.allclose(limits, expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"marker": "o"}, {"drawstyle": "steps"}, {"solid_capstyle": "round"}],
+)
+def test_data_ticks_line2d_kwargs_error(kwargs):
+    fig, ax = bpl.subplots()
+    with pytest.raises(AttributeError):
+        ax.data_ticks([1, 2], [1, 2], **kwargs)
+
+
+def test_data_ticks_capstyle():
+    fig, ax = bpl.subplots()
+    x_ticks, y_ticks = ax.data_ticks([1, 2], [1, 2], capstyle="round")
+    assert x_ticks.get_capstyle() == "round"
+    assert y_ticks.get_capstyle() == "round"
 
 
 # ------------------------------------------------------------------------------
@@ -925,6 +1177,35 @@ def test_errorbar_imperative():
     assert image_similarity_full(plt.gcf(), "errorbar_imperative.png")
 
 
+# ------------------------------------------------------------------------------
+#
+# Testing axvlines and axhlines
+#
+# ------------------------------------------------------------------------------
+def test_axvlines_segments():
+    fig, ax = bpl.subplots()
+    lines = ax.axvlines([1, 2, 3], ymin=0.25, ymax=0.5)
+    segments = lines.get_segments()
+    assert len(segments) == 3
+    assert np.allclose(segments[1], [[2, 0.25], [2, 0.5]])
+    assert lines.get_transform() == ax.get_xaxis_transform()
+
+
+def test_axhlines_segments():
+    fig, ax = bpl.subplots()
+    lines = ax.axhlines([1, 2], xmax=0.1)
+    assert np.allclose(lines.get_segments()[1], [[0, 2], [0.1, 2]])
+    assert lines.get_transform() == ax.get_yaxis_transform()
+
+
+def test_axvlines_color():
+    fig, ax = bpl.subplots()
+    default_lines = ax.axvlines([1, 2])
+    red_lines = ax.axvlines([1, 2], c="red")
+    assert np.allclose(default_lines.get_color(), to_rgba(bpl.almost_black))
+    assert np.allclose(red_lines.get_color(), to_rgba("red"))
+
+
 # ------------------------------------------------------------------------------
 #
 # Testing twin axis simple
@@ -993,6 +1274,14 @@ def test_shaded_density_basic_image():
     assert image_similarity_full(fig, "shaded_density_basic.png")
 
 
+def test_shaded_density_packed_points():
+    fig, ax = bpl.subplots()
+    separate = ax.shaded_density(xs_normal_500, ys_normal_500, bin_size=0.1)
+    points = np.column_stack([xs_normal_500, ys_normal_500])
+    packed = ax.shaded_density(points, bin_size=0.1)
+    assert np.array_equal(separate.get_array(), packed.get_array())
+
+
 @pass_local_fail_remote
 def test_shaded_density_points_are_inside_image():
     """Test that the scatter points to indeed lie in the regions they should."""
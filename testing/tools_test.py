@@ -1,10 +1,14 @@
+import subprocess
+import sys
+
 import matplotlib.pyplot as plt
 import pytest
 from pytest import approx
 import numpy as np
-from scipy import integrate
+from scipy import integrate, ndimage
 from matplotlib import path
-from betterplotlib import tools, get_axis, subplots
+import betterplotlib as bpl
+from betterplotlib import tools, get_axis, subplots, batch_apply, live_plot
 
 np.random.seed(19680801)
 random_x = np.random.normal(0, 1, 1000)
@@ -50,6 +54,125 @@ def test_get_axis_non_bpl_axis_only():
         get_axis()
 
 
+def test_get_axis_repeated_calls_same_axis():
+    clear_all_open_figures()
+    ax = get_axis()
+    assert get_axis() is ax
+    assert get_axis() is ax
+
+
+def test_get_axis_removed_axis_not_reused():
+    clear_all_open_figures()
+    fig, (ax1, ax2) = subplots(ncols=2)
+    assert get_axis() is ax1
+    ax1.remove()
+    assert get_axis() is ax2
+
+
+def test_get_axis_helpers_not_exported():
+    # the figure manager lookup is private to matplotlib, so get_axis shouldn't
+    # use it, and it shouldn't be in our namespace
+    assert not hasattr(bpl, "Gcf")
+    assert not hasattr(bpl.manage_axes, "_pylab_helpers")
+
+
+def test_get_axis_follows_current_figure():
+    clear_all_open_figures()
+    fig1, ax1 = subplots()
+    fig2, ax2 = subplots()
+    assert get_axis() is ax2
+    bpl.plt.figure(fig1.number)
+    assert get_axis() is ax1
+
+
+def test_manage_axes_only_exports_public_functions():
+    assert not hasattr(bpl, "contextlib")
+    for name in ["subplots", "get_axis", "batch_apply", "live_plot"]:
+        assert hasattr(bpl, name)
+
+
+def test_subplots_subplot_kw_none():
+    clear_all_open_figures()
+    fig, ax = subplots(subplot_kw=None)
+    assert ax.name == "bpl"
+
+
+def test_batch_apply_2d_array_of_axes():
+    clear_all_open_figures()
+    fig, axs = subplots(nrows=2, ncols=2)
+    results = batch_apply(axs, "set_limits", 0, 5, 1, 3)
+    assert len(results) == 4
+    for ax in axs.flat:
+        assert ax.get_xlim() == (0, 5)
+        assert ax.get_ylim() == (1, 3)
+
+
+def test_batch_apply_returns_in_order():
+    clear_all_open_figures()
+    fig, (ax1, ax2) = subplots(ncols=2)
+    lines = batch_apply([ax2, ax1], "axhline", 1)
+    assert lines[0].axes is ax2
+    assert lines[1].axes is ax1
+
+
+def test_live_plot_redraws_artists():
+    clear_all_open_figures()
+    fig, ax = subplots()
+    ax.set_limits(0, 1, 0, 1)
+    (line,) = ax.plot([], [], linewidth=10)
+    with live_plot(ax, [line]) as live:
+        assert line.get_animated()
+        live.update()
+        empty = np.array(fig.canvas.buffer_rgba())
+        line.set_data([0.2, 0.8], [0.2, 0.8])
+        live.update()
+        drawn = np.array(fig.canvas.buffer_rgba())
+        assert not np.array_equal(empty, drawn)
+        # going back to no data should restore the saved background exactly
+        line.set_data([], [])
+        live.update()
+        assert np.array_equal(empty, np.array(fig.canvas.buffer_rgba()))
+    assert not line.get_animated()
+
+
+def test_live_plot_default_axis():
+    clear_all_open_figures()
+    ax = get_axis()
+    with live_plot() as live:
+        assert live.ax is ax
+
+
+def test_import_does_not_load_pyplot():
+    # has to be a fresh interpreter, since pyplot is already loaded here
+    code = "import sys, betterplotlib; print('matplotlib.pyplot' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_plt_attribute_loads_pyplot():
+    # bpl.plt still works, it just isn't imported until it's used
+    code = (
+        "import sys, betterplotlib as bpl; "
+        "print('matplotlib.pyplot' in sys.modules); "
+        "print(bpl.plt is sys.modules['matplotlib.pyplot'])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+def test_import_does_not_load_scipy_ndimage():
+    # ndimage is only needed for density contours, so shouldn't be loaded upfront
+    code = "import sys, betterplotlib; print('scipy.ndimage' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
 # ------------------------------------------------------------------------------
 #
 # testing alpha. I don't test a lot here, since the actual values are just
@@ -220,6 +343,15 @@ def test_freedman_diaconis_example_b():
     assert real_bin_size == approx(test_bin_size)
 
 
+@pytest.mark.parametrize("n", [2, 3, 4, 5, 10, 101, 1000])
+def test_freedman_diaconis_matches_np_percentile(n):
+    """The quartiles should be interpolated exactly as np.percentile does."""
+    data = np.random.normal(0, 1, n)
+    q_25, q_75 = np.percentile(data, [25, 75])
+    expected = tools._freedman_diaconis_core(q_75 - q_25, n)
+    assert tools._freedman_diaconis(data) == expected
+
+
 # ------------------------------------------------------------------------------
 #
 # testing for the rounding of the bin sizes.
@@ -647,6 +779,68 @@ def test_two_element_list_strings_list_numeric_single():
     assert tools._two_item_list(["0.4"]) == ["0.4", "0.4"]
 
 
+# ------------------------------------------------------------------------------
+#
+# Unpacking (N, 2) arrays of points
+#
+# ------------------------------------------------------------------------------
+def test_unpack_points_separate_unchanged():
+    xs, ys = [1, 2], [3, 4]
+    assert tools._unpack_points(xs, ys) == (xs, ys)
+
+
+def test_unpack_points_packed_views():
+    points = np.array([[1.0, 3.0], [2.0, 4.0]])
+    xs, ys = tools._unpack_points(points, None)
+    assert np.array_equal(xs, [1, 2])
+    assert np.array_equal(ys, [3, 4])
+    assert np.shares_memory(xs, points)
+    assert np.shares_memory(ys, points)
+
+
+@pytest.mark.parametrize("xs", [[1, 2, 3], np.ones((3, 3))])
+def test_unpack_points_wrong_shape(xs):
+    with pytest.raises(ValueError) as err_msg:
+        tools._unpack_points(xs, None)
+    msg = "If ys is not passed, xs must be an (N, 2) array of points."
+    assert str(err_msg.value) == msg
+
+
+def test_data_arrays_converts_lists():
+    xs, ys = tools._data_arrays([1, 2], (3, 4))
+    assert isinstance(xs, np.ndarray) and xs.dtype == np.float64
+    assert isinstance(ys, np.ndarray) and ys.dtype == np.float64
+    assert np.array_equal(xs, [1, 2])
+    assert np.array_equal(ys, [3, 4])
+
+
+def test_data_arrays_leaves_arrays():
+    xs, ys = np.array([1.0, 2.0]), np.array([3.0, 4.0])
+    xs_out, ys_out = tools._data_arrays(xs, ys)
+    assert xs_out is xs
+    assert ys_out is ys
+
+
+def test_data_arrays_not_numeric():
+    with pytest.raises(TypeError) as err_msg:
+        tools._data_arrays(["a", "b"], [1, 2])
+    assert str(err_msg.value) == "x must be a numerical array."
+
+
+@pytest.mark.parametrize(
+    "values,answer",
+    [
+        ([1, 1, 1], True),
+        (np.full(1000, 2.5), True),
+        ([4], True),
+        ([1, 1, 2], False),
+        ([], False),
+    ],
+)
+def test_all_same(values, answer):
+    assert tools._all_same(values) == answer
+
+
 # ------------------------------------------------------------------------------
 
 # Testing the parsing of the bin options. This relies heavily on the _binning
@@ -899,6 +1093,85 @@ def test_make_bins_all_same_size(bin_size):
         assert bins[idx + 1] - bins[idx] == approx(real_bin_size)
 
 
+# ------------------------------------------------------------------------------
+#
+# Testing the 2D histogram
+#
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize("bin_size", [0.1, 0.25, 1 / 3])
+@pytest.mark.parametrize("weighted", [True, False])
+def test_histogram_2d_matches_numpy(bin_size, weighted):
+    # rounding the data to multiples of the bin size puts lots of points right
+    # on the bin edges, where floating point error matters
+    xs = np.round(np.random.normal(0, 2, 2000) / bin_size) * bin_size
+    ys = np.random.normal(0, 1, 2000)
+    weights = np.random.uniform(0, 1, 2000) if weighted else None
+    x_edges = tools.make_bins(xs, bin_size)
+    y_edges = tools.make_bins(ys, bin_size)
+    # also cut off some edges, so some points are outside the bins
+    for x_e in [x_edges, x_edges[3:-3]]:
+        hist, _, _ = tools._histogram_2d(xs, ys, x_e, y_edges, weights)
+        true_hist, _, _ = np.histogram2d(xs, ys, [x_e, y_edges], weights=weights)
+        assert np.array_equal(hist, true_hist)
+
+
+def test_histogram_2d_uneven_edges():
+    xs = [0.5, 1.5, 5.0, 10.0]
+    ys = [0.5, 0.5, 0.5, 0.5]
+    x_edges = [0, 1, 2, 10]
+    hist, _, _ = tools._histogram_2d(xs, ys, x_edges, [0, 1])
+    assert np.array_equal(hist, [[1], [1], [2]])
+
+
+# ------------------------------------------------------------------------------
+#
+# Testing the Gaussian smoothing of histograms
+#
+# ------------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "shape,sigmas", [((300, 200), (40, 15)), ((30, 40), (2, 25)), ((20, 25), (0, 12))]
+)
+def test_gaussian_smooth_matches_ndimage(shape, sigmas):
+    hist = np.zeros(shape)
+    # put data near one edge, so the reflection at the boundaries matters
+    hist[2:7, 4:9] = np.random.poisson(5, (5, 5))
+    true_smooth = ndimage.gaussian_filter(hist, sigmas)
+    smooth = tools._gaussian_smooth(hist, sigmas)
+    assert np.allclose(smooth, true_smooth, rtol=0, atol=1e-12 * np.max(true_smooth))
+    # cells that should be empty are exactly empty
+    assert np.array_equal(smooth == 0, true_smooth == 0)
+
+
+def test_gaussian_smooth_weights_over_many_orders_of_magnitude():
+    # rows with weights 1e-14 times the others shouldn't be mistaken for the FFT
+    # noise from the big rows and get set to zero
+    hist = np.zeros((10, 80))
+    hist[2, 30:35] = 1e3
+    hist[7, 40:45] = 1e-11
+    true_smooth = ndimage.gaussian_filter(hist, [0, 12])
+    smooth = tools._gaussian_smooth(hist, [0, 12])
+    for row in [2, 7]:
+        assert np.max(smooth[row]) > 0
+        row_max = np.max(true_smooth[row])
+        assert np.allclose(smooth[row], true_smooth[row], rtol=0, atol=1e-12 * row_max)
+    assert np.array_equal(smooth == 0, true_smooth == 0)
+
+
+def test_gaussian_smooth_small_kernel_identical():
+    hist = np.random.poisson(3, (50, 60)).astype(float)
+    smooth = tools._gaussian_smooth(hist, [1.5, 4])
+    assert np.array_equal(smooth, ndimage.gaussian_filter(hist, [1.5, 4]))
+
+
+def test_gaussian_kernel1d_cached_read_only():
+    kernel = tools._gaussian_kernel1d(2.5)
+    assert tools._gaussian_kernel1d(2.5) is kernel
+    assert len(kernel) == 2 * 10 + 1
+    assert np.sum(kernel) == approx(1)
+    with pytest.raises(ValueError):
+        kernel[0] = 1
+
+
 # ------------------------------------------------------------------------------
 
 # Testing the unique_total
@@ -949,6 +1222,13 @@ def test_unique_total_is_finally_sorted():
     assert sorted(new_data) == approx(new_data)
 
 
+def test_unique_total_return_unique():
+    data = [0.4, 0.1, 0.3, 0.4, 0.3, 0.4]
+    unique, new_data = tools._unique_total_sorted(data, return_unique=True)
+    assert approx(unique) == [0.1, 0.3, 0.4]
+    assert approx(new_data) == [0.1, 0.6, 1.2]
+
+
 # ------------------------------------------------------------------------------
 
 # Testing the level that contains certain percentages
@@ -1653,6 +1933,16 @@ def test_hist_2d_results_right_height_with_weights_with_dups():
     assert np.max(hist) == 5
 
 
+def test_hist_2d_log_does_not_modify_data():
+    xs = np.logspace(0, 3, 100)
+    ys = np.logspace(1, 2, 100)
+    xs_original = xs.copy()
+    ys_original = ys.copy()
+    tools.smart_hist_2d(xs, ys, bin_size=0.1, log=True)
+    assert np.array_equal(xs, xs_original)
+    assert np.array_equal(ys, ys_original)
+
+
 def test_hist_2d_results_orientation():
     xs = [0.75, 0.75, 1.25]
     ys = [0.75, 1.25, 1.25]
@@ -1855,3 +2145,58 @@ def test_gaussian_integration_over_three_sigma():
 
     result = integrate.quad(integrand, -2, 4)[0]
     assert np.isclose(result, 0.9973, rtol=0, atol=0.00001)
+
+
+# ------------------------------------------------------------------------------
+#
+# Testing inverting monotonic functions for twin_axis
+#
+# ------------------------------------------------------------------------------
+def test_invert_monotonic_increasing():
+    result = tools._invert_monotonic(np.sqrt, [1, 2, 3], 0, 10)
+    assert result == approx([1, 4, 9], rel=1e-12)
+
+
+def test_invert_monotonic_decreasing():
+    result = tools._invert_monotonic(lambda x: -2 * x, [-1, -4], 0, 10)
+    assert result == approx([0.5, 2], rel=1e-12)
+
+
+def test_invert_monotonic_log_grid():
+    result = tools._invert_monotonic(np.log10, [0, 1.5, 3], 1, 1000, log=True)
+    assert result == approx([1, 10**1.5, 1000], rel=1e-12)
+
+
+def test_invert_monotonic_out_of_range_nan():
+    result = tools._invert_monotonic(np.sqrt, [-1, 2, 4], 0, 10)
+    assert np.isnan(result[0])
+    assert result[1] == approx(4, rel=1e-12)
+    assert np.isnan(result[2])
+
+
+def test_invert_monotonic_scalar_function_none():
+    def scalar_only(x):
+        return float(x) ** 2
+
+    assert tools._invert_monotonic(scalar_only, [1, 2], 0, 10) is None
+
+
+def test_invert_monotonic_scalar_if_function_none():
+    def scalar_only(x):
+        if x > 5:
+            return x
+        return x / 2
+
+    assert tools._invert_monotonic(scalar_only, [1, 2], 0, 10) is None
+
+
+def test_invert_monotonic_function_errors_not_hidden():
+    def buggy(x):
+        return np.sqrt(x) * undefined_scale  # noqa: F821
+
+    with pytest.raises(NameError):
+        tools._invert_monotonic(buggy, [1, 2], 0, 10)
+
+
+def test_invert_monotonic_not_monotonic_none():
+    assert tools._invert_monotonic(lambda x: (x - 5) ** 2, [1, 4], 0, 10) is None